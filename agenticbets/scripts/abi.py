@@ -0,0 +1,157 @@
+"""Minimal Solidity ABI calldata encoder for the AgenticBets CLI.
+
+Covers what the prediction and USDC contracts need: static `address`,
+`uintN`, `bool` and `bytes32` arguments, plus dynamic `T[]` arrays of those
+and `bytes`. Each signature is compiled once into per-argument writers;
+calldata is written into one preallocated bytearray and hex-encoded once,
+instead of concatenating a zero-padded hex string per word.
+
+    >>> encode_call("claim(address,uint256[])", ["0x37d1...", [1, 2, 3]])
+    '0x45718278...'
+"""
+
+# keccak256(signature)[:4], precomputed — hashlib has no keccak.
+SELECTORS = {
+    "approve(address,uint256)": bytes.fromhex("095ea7b3"),
+    "allowance(address,address)": bytes.fromhex("dd62ed3e"),
+    "bet(address,uint256,uint8)": bytes.fromhex("37a02e62"),
+    "claim(address,uint256[])": bytes.fromhex("45718278"),
+    "claimable(address,uint256,address)": bytes.fromhex("d3c035fc"),
+}
+
+WORD = 32
+
+
+def _put_address(buf, offset, value):
+    raw = bytes.fromhex(value[2:] if value[:2] in ("0x", "0X") else value)
+    if len(raw) != 20:
+        raise ValueError(f"address must be 20 bytes: {value!r}")
+    buf[offset + 12 : offset + WORD] = raw
+
+
+def _put_bool(buf, offset, value):
+    buf[offset + WORD - 1] = 1 if value else 0
+
+
+def _put_bytes32(buf, offset, value):
+    if len(value) != WORD:
+        raise ValueError("bytes32 value must be exactly 32 bytes")
+    buf[offset : offset + WORD] = value
+
+
+def _put_uint256(buf, offset, value):
+    # to_bytes raises OverflowError for negatives and values over 256 bits.
+    buf[offset : offset + WORD] = value.to_bytes(WORD, "big")
+
+
+def _uint_writer(bits):
+    if bits == 256:
+        return _put_uint256
+
+    def put(buf, offset, value):
+        if value < 0 or value >> bits:
+            raise ValueError(f"{value} does not fit in uint{bits}")
+        buf[offset : offset + WORD] = value.to_bytes(WORD, "big")
+
+    return put
+
+
+def _static_writer(abi_type):
+    if abi_type == "address":
+        return _put_address
+    if abi_type == "bool":
+        return _put_bool
+    if abi_type == "bytes32":
+        return _put_bytes32
+    if abi_type.startswith("uint"):
+        bits = int(abi_type[4:] or 256)
+        if bits % 8 or not 8 <= bits <= 256:
+            raise ValueError(f"unsupported ABI type: {abi_type}")
+        return _uint_writer(bits)
+    raise ValueError(f"unsupported ABI type: {abi_type}")
+
+
+def _put_bytes(buf, offset, value):
+    """Write length-prefixed dynamic bytes; returns the bytes used."""
+    _put_uint256(buf, offset, len(value))
+    buf[offset + WORD : offset + WORD + len(value)] = value
+    return WORD + -(-len(value) // WORD) * WORD
+
+
+def _array_writer(item_type):
+    """Writer for a length-prefixed T[]; returns the bytes used."""
+    if item_type == "uint256":
+        def put(buf, offset, values):
+            # Hot path (claim epochs): one C-level pass instead of a call per word.
+            _put_uint256(buf, offset, len(values))
+            end = offset + WORD * (len(values) + 1)
+            buf[offset + WORD : end] = b"".join([v.to_bytes(WORD, "big") for v in values])
+            return end - offset
+        return put
+
+    item_writer = _static_writer(item_type)
+
+    def put(buf, offset, values):
+        _put_uint256(buf, offset, len(values))
+        for j, item in enumerate(values, 1):
+            item_writer(buf, offset + WORD * j, item)
+        return WORD * (len(values) + 1)
+
+    return put
+
+
+def _tail_size(abi_type, value):
+    """Bytes a dynamic argument occupies after the head (length word + data)."""
+    if abi_type == "bytes":
+        return WORD + -(-len(value) // WORD) * WORD
+    return WORD * (len(value) + 1)
+
+
+class Encoder:
+    """A function signature compiled into per-argument writers."""
+
+    def __init__(self, signature, selector=b""):
+        inner = signature[signature.index("(") + 1 : signature.rindex(")")]
+        self.types = inner.split(",") if inner else []
+        self.selector = selector
+        self.head_size = WORD * len(self.types)
+        self.static = []   # (head offset, arg index, writer)
+        self.dynamic = []  # (head offset, arg index, type, writer)
+        for i, abi_type in enumerate(self.types):
+            offset = len(selector) + WORD * i
+            if abi_type == "bytes":
+                self.dynamic.append((offset, i, abi_type, _put_bytes))
+            elif abi_type.endswith("[]"):
+                self.dynamic.append((offset, i, abi_type, _array_writer(abi_type[:-2])))
+            else:
+                self.static.append((offset, i, _static_writer(abi_type)))
+
+    def encode(self, values):
+        """Encode argument values into calldata (selector included) as a bytearray."""
+        if len(values) != len(self.types):
+            raise ValueError(f"expected {len(self.types)} arguments, got {len(values)}")
+        base = len(self.selector)
+        size = base + self.head_size
+        for _, i, abi_type, _ in self.dynamic:
+            size += _tail_size(abi_type, values[i])
+        buf = bytearray(size)  # zero-filled, so padding never needs writing
+        buf[:base] = self.selector
+        for offset, i, writer in self.static:
+            writer(buf, offset, values[i])
+        tail = self.head_size  # tail offsets are relative to the start of the arguments
+        for offset, i, _, writer in self.dynamic:
+            _put_uint256(buf, offset, tail)
+            tail += writer(buf, base + tail, values[i])
+        return buf
+
+
+_ENCODERS = {sig: Encoder(sig, selector) for sig, selector in SELECTORS.items()}
+
+
+def encode_call(signature, values):
+    """Encode a call to `signature` as 0x-prefixed hex calldata."""
+    try:
+        encoder = _ENCODERS[signature]
+    except KeyError:
+        raise ValueError(f"no precomputed selector for {signature}") from None
+    return "0x" + encoder.encode(values).hex()
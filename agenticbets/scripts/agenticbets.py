@@ -5,28 +5,194 @@ Uses the AgenticBets Markets API for reads and Bankr Submit API for writes.
 
 Usage: scripts/agenticbets.py <command> [args...]
 
+Options:
+  --fresh       Bypass the local market snapshot cache for this run
+  --stats       Print HTTP connection reuse stats to stderr on exit
+
 Environment:
-  BANKR_CONFIG  Path to Bankr config file (default: ~/.bankr/config.json)
+  BANKR_CONFIG           Path to Bankr config file (default: ~/.bankr/config.json)
+  BASE_RPC_URL           Base JSON-RPC endpoint for contract reads (default: https://mainnet.base.org)
+  AGENTICBETS_CACHE_DIR  Market snapshot cache directory (default: ~/.cache/agenticbets)
+  AGENTICBETS_CACHE_TTL  Seconds a cached market snapshot is served without a refetch (default: 10)
+  AGENTICBETS_ALLOWANCE_TTL  Seconds a cached USDC allowance is trusted (default: 30)
+  AGENTICBETS_APPROVE_BUDGET Default USDC approve budget for bet (default: 0 = exact amount)
 """
 
+import atexit
+import bisect
+import csv
+import difflib
+import functools
+import http.client
 import json
 import os
+import select
 import sys
-import urllib.request
-import urllib.error
+import threading
+import time
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from abi import encode_call
 
 MARKETS_API = "https://agenticbets.dev/api/bankr/markets"
 BANKR_API = "https://api.bankr.bot"
 USDC_ADDRESS = "0x833589fCD6eDb6E08f4c7C32D4f71b54bdA02913"
 USDC_DECIMALS = 6
 BASE_CHAIN_ID = 8453
+BASE_RPC_URL = os.environ.get("BASE_RPC_URL", "https://mainnet.base.org")
+RPC_BATCH_SIZE = 100  # eth_calls per JSON-RPC batch; public endpoints cap batch size
+
+# Unverified guesses at claim() gas cost, used only for the first split of a
+# large claim; every planned claim is then checked with eth_estimateGas.
+CLAIM_BASE_GAS = 60_000
+CLAIM_GAS_PER_EPOCH = 40_000
+DEFAULT_CLAIM_MAX_GAS = 2_000_000
+
+# Market statuses that accept bets (the first bet on a not_started market
+# starts its round); anything else (locked, settled, cancelled, or a status
+# this script does not know yet) is rejected.
+BETTABLE_STATUSES = ("open", "not_started")
+MIN_BET_RAW = 1_000_000  # 1 USDC; smaller bets revert with BelowMinBet()
 
 # V1 — existing markets; V2 — AGBETS
 PREDICTION_V1 = "0xABADeb002247f2bd908Eeedb32918aEc304A0233"
 PREDICTION_V2 = "0x2CD785Ba87e0841A8458141bc43d23a56a00557f"
 AGBETS_TOKEN = "0x37d183FCf1DA460a64D21E754b3E6144C4e11BA3"
 
+# The Markets API caches ~10s server-side, so a fresher local copy buys nothing.
+CACHE_DIR = os.environ.get("AGENTICBETS_CACHE_DIR", os.path.expanduser("~/.cache/agenticbets"))
+MARKETS_CACHE_TTL = float(os.environ.get("AGENTICBETS_CACHE_TTL", "10"))
+MARKETS_CACHE_FILE = os.path.join(CACHE_DIR, "markets.json")
+ALLOWANCE_CACHE_TTL = float(os.environ.get("AGENTICBETS_ALLOWANCE_TTL", "30"))
+ALLOWANCE_CACHE_FILE = os.path.join(CACHE_DIR, "allowances.json")
+
+USER_AGENT = "agenticbets-bankr-skill/1.0"
+
+# Set by --fresh: skip the snapshot cache for every read in this run.
+FORCE_FRESH = False
+
+
+class RequestError(Exception):
+    """A Bankr API or Base RPC request failed; the message is ready to show the user."""
+
+
+class HttpSession:
+    """Keep-alive HTTP(S) connections, one per host and thread, reused across requests.
+
+    urllib opens and TLS-handshakes a new connection for every call; a bet
+    makes three Bankr calls in a row, so reusing one socket saves two
+    handshakes. Requests on a connection are sequential — http.client has no
+    pipelining, and each Bankr write depends on the previous one confirming.
+    """
+
+    # Raised when a kept-alive socket was closed by the server while idle.
+    STALE_ERRORS = (http.client.RemoteDisconnected, http.client.CannotSendRequest,
+                    ConnectionResetError, BrokenPipeError)
+
+    # A write is never re-sent after a stale-socket error (the server may have
+    # acted on it), so it only goes out on a connection idle for less than this;
+    # servers commonly close idle keep-alive sockets after a few seconds.
+    WRITE_IDLE_LIMIT = 2.0
+
+    def __init__(self):
+        self.local = threading.local()
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.connections = 0
+
+    @property
+    def conns(self):
+        # http.client connections are not thread-safe, so each thread keeps its own.
+        if not hasattr(self.local, "conns"):
+            self.local.conns = {}
+        return self.local.conns
+
+    def _connect(self, scheme, host, timeout):
+        conn_cls = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        conn = conn_cls(host, timeout=timeout)
+        conn.last_used = time.monotonic()
+        self.conns[(scheme, host)] = conn
+        with self.lock:
+            self.connections += 1
+        return conn
+
+    def _drop(self, key):
+        conn = self.conns.pop(key, None)
+        if conn:
+            conn.close()
+
+    @staticmethod
+    def _closed_by_peer(conn):
+        """True if an idle socket is readable, i.e. the server closed it (or sent junk)."""
+        if conn.sock is None:
+            return False
+        try:
+            readable, _, _ = select.select([conn.sock], [], [], 0)
+        except (OSError, ValueError):
+            return True
+        return bool(readable)
+
+    def request(self, method, url, body=None, headers=None, timeout=60):
+        """Send a request and return (status, headers, body bytes)."""
+        parts = urllib.parse.urlsplit(url)
+        key = (parts.scheme, parts.netloc)
+        path = parts.path + (f"?{parts.query}" if parts.query else "")
+        while True:
+            conn = self.conns.get(key)
+            if conn is not None and (self._closed_by_peer(conn) or (
+                    method != "GET" and time.monotonic() - conn.last_used > self.WRITE_IDLE_LIMIT)):
+                self._drop(key)  # reopen rather than risk a write the server drops unanswered
+                conn = None
+            reused = conn is not None
+            if conn is None:
+                conn = self._connect(parts.scheme, parts.netloc, timeout)
+            conn.timeout = timeout
+            if conn.sock:
+                conn.sock.settimeout(timeout)
+            sent = False
+            try:
+                conn.request(method, path, body=body, headers=headers or {})
+                sent = True
+                resp = conn.getresponse()
+                data = resp.read()
+            except self.STALE_ERRORS:
+                self._drop(key)
+                # Retry once on a fresh socket, but never re-send a write the
+                # server may already have received.
+                if reused and (not sent or method == "GET"):
+                    continue
+                raise
+            except (OSError, http.client.HTTPException):
+                # A truncated or garbled response leaves the socket unusable.
+                self._drop(key)
+                raise
+            conn.last_used = time.monotonic()
+            if resp.will_close:
+                self._drop(key)
+            with self.lock:
+                self.requests += 1
+            return resp.status, resp.headers, data
+
+    def close(self):
+        for key in list(self.conns):
+            self._drop(key)
+
+
+HTTP = HttpSession()
 
+
+def print_http_stats():
+    """--stats hook: report how many connection setups keep-alive avoided."""
+    saved = max(0, HTTP.requests - HTTP.connections)
+    print(
+        f"HTTP: {HTTP.requests} requests over {HTTP.connections} connections "
+        f"({saved} TLS handshakes saved)",
+        file=sys.stderr,
+    )
+
+
+@functools.lru_cache(maxsize=None)
 def load_bankr_key():
     """Read Bankr API key from config."""
     config_path = os.environ.get("BANKR_CONFIG", os.path.expanduser("~/.bankr/config.json"))
@@ -44,28 +210,31 @@ def load_bankr_key():
 
 
 def bankr_request(method, path, body=None):
-    """Make an authenticated request to Bankr Wallet API."""
+    """Make an authenticated request to Bankr Wallet API; raises RequestError on failure."""
     api_key = load_bankr_key()
-    url = f"{BANKR_API}{path}"
     data = json.dumps(body).encode() if body else None
-    req = urllib.request.Request(
-        url,
-        data=data,
-        headers={
-            "X-API-Key": api_key,
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-            "User-Agent": "agenticbets-bankr-skill/1.0",
-        },
-        method=method,
-    )
     try:
-        with urllib.request.urlopen(req, timeout=60) as resp:
-            return json.loads(resp.read())
-    except urllib.error.HTTPError as e:
-        body_text = e.read().decode() if e.fp else ""
-        print(f"Bankr API error: {e.code} {e.reason} — {body_text}", file=sys.stderr)
-        sys.exit(1)
+        status, _, raw = HTTP.request(
+            method,
+            f"{BANKR_API}{path}",
+            body=data,
+            headers={
+                "X-API-Key": api_key,
+                "Content-Type": "application/json",
+                "Accept": "application/json",
+                "User-Agent": USER_AGENT,
+            },
+            timeout=60,
+        )
+    except (OSError, http.client.HTTPException) as e:
+        raise RequestError(f"Bankr API error: {str(e) or type(e).__name__}") from None
+    if status >= 400:
+        reason = http.client.responses.get(status, "")
+        raise RequestError(f"Bankr API error: {status} {reason} — {raw.decode(errors='replace')}")
+    try:
+        return json.loads(raw)
+    except ValueError:
+        raise RequestError(f"Bankr API error: unreadable response ({len(raw)} bytes)") from None
 
 
 def get_wallet_address():
@@ -74,8 +243,12 @@ def get_wallet_address():
     return data.get("address") or data.get("walletAddress")
 
 
-def submit_tx(to, data_hex, description="", value="0"):
-    """Submit a transaction via Bankr Submit API."""
+def submit_tx(to, data_hex, description="", value="0", wait=True):
+    """Submit a transaction via Bankr Submit API.
+
+    With wait=False the call returns once Bankr has broadcast the
+    transaction; confirm it with wait_for_receipt().
+    """
     tx = {
         "to": to,
         "chainId": BASE_CHAIN_ID,
@@ -85,7 +258,7 @@ def submit_tx(to, data_hex, description="", value="0"):
     result = bankr_request("POST", "/wallet/submit", {
         "transaction": tx,
         "description": description,
-        "waitForConfirmation": True,
+        "waitForConfirmation": wait,
     })
     tx_hash = result.get("transactionHash") or result.get("hash") or result.get("txHash")
     status = result.get("status", "unknown")
@@ -94,29 +267,276 @@ def submit_tx(to, data_hex, description="", value="0"):
     return tx_hash
 
 
-def fetch_markets():
-    """Fetch markets from AgenticBets API."""
-    req = urllib.request.Request(
-        MARKETS_API,
-        headers={"Accept": "application/json", "User-Agent": "agenticbets-bankr-skill/1.0"},
-    )
+def rpc_batch(calls, allow_errors=False):
+    """Run JSON-RPC calls as batched POSTs; returns results in call order.
+
+    `calls` is a list of (method, params). Calls are sent RPC_BATCH_SIZE at a
+    time over the shared keep-alive connection. A failed request raises
+    RequestError, as does a call the node answers with an error unless
+    allow_errors is set, in which case it comes back as {"error": ...}.
+    """
+    results = []
+    for start in range(0, len(calls), RPC_BATCH_SIZE):
+        chunk = calls[start:start + RPC_BATCH_SIZE]
+        payload = [
+            {"jsonrpc": "2.0", "id": i, "method": method, "params": params}
+            for i, (method, params) in enumerate(chunk)
+        ]
+        try:
+            status, _, raw = HTTP.request(
+                "POST",
+                BASE_RPC_URL,
+                body=json.dumps(payload).encode(),
+                headers={"Content-Type": "application/json", "User-Agent": USER_AGENT},
+                timeout=60,
+            )
+            if status != 200:
+                raise OSError(f"HTTP {status}")
+            replies = json.loads(raw)
+        except (OSError, http.client.HTTPException, ValueError) as e:
+            raise RequestError(f"ERROR: Base RPC request failed — {e}") from None
+        if isinstance(replies, dict):
+            # Some endpoints answer a rejected batch with a single error object.
+            raise RequestError(f"ERROR: Base RPC rejected batch — {replies.get('error')}")
+        by_id = {r.get("id"): r for r in replies}
+        for i in range(len(chunk)):
+            reply = by_id.get(i, {})
+            if allow_errors and ("error" in reply or "result" not in reply):
+                results.append({"error": reply.get("error", "no result")})
+                continue
+            if "error" in reply or "result" not in reply:
+                raise RequestError(f"ERROR: Base RPC call failed — {reply.get('error', 'no result')}")
+            results.append(reply["result"])
+    return results
+
+
+def eth_call(to, data_hex):
+    """Read-only contract call on Base at the latest block."""
+    return rpc_batch([("eth_call", [{"to": to, "data": data_hex}, "latest"])])[0]
+
+
+def wait_for_receipt(tx_hash, timeout=180, poll_interval=2):
+    """Poll Base RPC until the transaction is mined; returns True if it succeeded."""
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        receipt = rpc_batch([("eth_getTransactionReceipt", [tx_hash])])[0]
+        if receipt:
+            return receipt.get("status") == "0x1"
+        time.sleep(poll_interval)
+    raise TimeoutError(f"no receipt for {tx_hash} after {timeout}s")
+
+
+def approve_succeeded(tx_hash):
+    """Check an approve's receipt; print why and return False if it reverted or never confirmed."""
     try:
-        with urllib.request.urlopen(req, timeout=30) as resp:
-            data = json.loads(resp.read())
-        return data["markets"]
+        if wait_for_receipt(tx_hash):
+            return True
+        print(f"ERROR: USDC approve reverted: https://basescan.org/tx/{tx_hash}", file=sys.stderr)
+    except (TimeoutError, RequestError) as e:
+        print(f"ERROR: USDC approve not confirmed — {e}", file=sys.stderr)
+    return False
+
+
+def decode_uint(result_hex):
+    """Decode a single uint256/bool return value."""
+    return int(result_hex, 16) if result_hex not in ("0x", "") else 0
+
+
+def load_allowance_cache():
+    try:
+        with open(ALLOWANCE_CACHE_FILE) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def read_allowance(owner, spender, fresh=False):
+    """USDC allowance of owner for spender, from a short-lived cache or eth_call.
+
+    The cache is keyed by (owner, spender) and also carries the locally
+    spent-down remainder of an approve budget between bets.
+    """
+    key = f"{owner.lower()}:{spender.lower()}"
+    entry = None if fresh else load_allowance_cache().get(key)
+    if entry and time.time() - entry["at"] < ALLOWANCE_CACHE_TTL:
+        return int(entry["amount"])
+    amount = decode_uint(eth_call(USDC_ADDRESS, encode_allowance(owner, spender)))
+    store_allowance(owner, spender, amount)
+    return amount
+
+
+def store_allowance(owner, spender, amount):
+    cache = load_allowance_cache()
+    cache[f"{owner.lower()}:{spender.lower()}"] = {"amount": str(amount), "at": time.time()}
+    write_cache_file(ALLOWANCE_CACHE_FILE, cache)
+
+
+def load_markets_snapshot():
+    """Read the cached market snapshot, or None if missing/unreadable."""
+    try:
+        with open(MARKETS_CACHE_FILE) as f:
+            snapshot = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(snapshot.get("markets"), list):
+        return None
+    return snapshot
+
+
+def write_cache_file(path, obj):
+    """Atomically write a JSON cache file so concurrent runs never see a partial file."""
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(obj, f)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass  # caching is best-effort; a read-only home dir must not break commands
+
+
+def save_markets_snapshot(snapshot):
+    write_cache_file(MARKETS_CACHE_FILE, snapshot)
+
+
+def refresh_time_fields(markets, fetched_at):
+    """Age `secondsToLock` by the time elapsed since the snapshot was fetched."""
+    elapsed = int(time.time() - fetched_at)
+    for m in markets:
+        if m.get("secondsToLock") is None:
+            continue
+        if m.get("lockTimestamp"):
+            m["secondsToLock"] = max(0, int(m["lockTimestamp"] - time.time()))
+        else:
+            m["secondsToLock"] = max(0, m["secondsToLock"] - elapsed)
+    return markets
+
+
+def revalidate_markets(snapshot=None):
+    """Conditionally download the market list.
+
+    Sends the snapshot's ETag/Last-Modified validators. Returns
+    (snapshot, modified): on 304 the given snapshot is kept with its TTL
+    restarted, otherwise a new snapshot is built. Either way it is saved.
+    """
+    headers = {"Accept": "application/json", "User-Agent": USER_AGENT}
+    if snapshot and snapshot.get("etag"):
+        headers["If-None-Match"] = snapshot["etag"]
+    if snapshot and snapshot.get("lastModified"):
+        headers["If-Modified-Since"] = snapshot["lastModified"]
+    try:
+        status, resp_headers, raw = HTTP.request("GET", MARKETS_API, headers=headers, timeout=30)
+        if status == 304 and snapshot:
+            # Not modified: the cached body is still current, restart its TTL.
+            refresh_time_fields(snapshot["markets"], snapshot["fetchedAt"])
+            snapshot["fetchedAt"] = time.time()
+            save_markets_snapshot(snapshot)
+            return snapshot, False
+        if status != 200:
+            raise OSError(f"HTTP {status}")
+        markets = json.loads(raw)["markets"]
     except Exception as e:
         print(f"ERROR: Failed to fetch markets — {e}", file=sys.stderr)
         sys.exit(1)
 
+    snapshot = {
+        "fetchedAt": time.time(),
+        "etag": resp_headers.get("ETag"),
+        "lastModified": resp_headers.get("Last-Modified"),
+        "markets": markets,
+    }
+    save_markets_snapshot(snapshot)
+    return snapshot, True
+
+
+def fetch_markets(fresh=False):
+    """Fetch markets from AgenticBets API, served from the local snapshot when recent.
 
-def find_market(symbol_or_address):
+    A snapshot younger than AGENTICBETS_CACHE_TTL is returned without a request;
+    an older one is revalidated with ETag/If-Modified-Since. `fresh=True` (or
+    --fresh) always downloads the full list and never reads the snapshot.
+    """
+    fresh = fresh or FORCE_FRESH
+    snapshot = None if fresh else load_markets_snapshot()
+    if snapshot and time.time() - snapshot.get("fetchedAt", 0) < MARKETS_CACHE_TTL:
+        return refresh_time_fields(snapshot["markets"], snapshot["fetchedAt"])
+    snapshot, _ = revalidate_markets(snapshot)
+    return snapshot["markets"]
+
+
+class MarketIndex:
+    """Lookup tables over one fetched market list.
+
+    Built once per fetch so every lookup is a dict hit instead of a scan that
+    lowercases each market's symbol and token again.
+    """
+
+    def __init__(self, markets):
+        self.markets = markets
+        self.by_key = {}
+        self.by_status = {}
+        for m in markets:
+            # setdefault keeps the first match, like the old linear scan did.
+            self.by_key.setdefault(m["symbol"].lower(), m)
+            self.by_key.setdefault(m["token"].lower(), m)
+            self.by_status.setdefault(m["status"], []).append(m)
+        self.symbols = sorted({m["symbol"].lower() for m in markets})
+
+    def get(self, query):
+        """Exact match on symbol or token address (case-insensitive)."""
+        return self.by_key.get(query.lower().lstrip("$"))
+
+    def prefix(self, query):
+        """Markets whose symbol starts with `query`, in symbol order."""
+        q = query.lower().lstrip("$")
+        start = bisect.bisect_left(self.symbols, q)
+        matches = []
+        for sym in self.symbols[start:]:
+            if not sym.startswith(q):
+                break
+            matches.append(self.by_key[sym])
+        return matches
+
+    def fuzzy(self, query, limit=3):
+        """Closest symbols to `query` — for typo suggestions, never for writes."""
+        q = query.lower().lstrip("$")
+        return [self.by_key[s] for s in difflib.get_close_matches(q, self.symbols, n=limit, cutoff=0.6)]
+
+    def resolve_many(self, queries):
+        """Exact-resolve several symbols/addresses; unknown ones map to None."""
+        return [(q, self.get(q)) for q in queries]
+
+    def suggest(self, query, limit=3):
+        """Prefix matches first, then fuzzy ones, without duplicates."""
+        seen = []
+        for m in self.prefix(query) + self.fuzzy(query, limit):
+            if m not in seen:
+                seen.append(m)
+        return seen[:limit]
+
+    def with_status(self, status):
+        """Markets with the given status, or every market for "all"."""
+        if status == "all":
+            return self.markets
+        return self.by_status.get(status, [])
+
+
+def market_index(fresh=False):
+    """Fetch markets and index them by symbol, token address and status."""
+    return MarketIndex(fetch_markets(fresh=fresh))
+
+
+def find_market(symbol_or_address, fresh=False):
     """Find a market by symbol or token address."""
-    markets = fetch_markets()
-    q = symbol_or_address.lower()
-    for m in markets:
-        if m["symbol"].lower() == q or m["token"].lower() == q:
-            return m
-    return None
+    return market_index(fresh=fresh).get(symbol_or_address)
+
+
+def print_market_not_found(index, symbol):
+    """Report an unknown symbol, with close matches when there are any."""
+    print(f"No market found for '{symbol}'")
+    suggestions = index.suggest(symbol)
+    if suggestions:
+        print("  Did you mean: " + ", ".join(f"${m['symbol']}" for m in suggestions) + "?")
 
 
 def get_prediction_contract(token_address):
@@ -126,50 +546,52 @@ def get_prediction_contract(token_address):
     return PREDICTION_V1
 
 
+def parse_usdc(amount):
+    """Exact USDC amount string -> smallest units, without a float round-trip.
+
+    Raises ValueError for malformed input ("1.2.3", "-1", "1e6") or more than
+    USDC_DECIMALS decimal places.
+    """
+    whole, _, frac = amount.partition(".")
+    if not (amount.isascii() and (whole or frac) and (whole.isdigit() or not whole)
+            and (frac.isdigit() or not frac)):
+        raise ValueError(f"invalid amount: {amount!r}")
+    if frac[USDC_DECIMALS:].strip("0"):
+        raise ValueError(f"{amount!r} has more than {USDC_DECIMALS} decimal places")
+    frac = frac[:USDC_DECIMALS]
+    return int(whole + frac or "0") * 10 ** (USDC_DECIMALS - len(frac))
+
+
 def encode_approve(spender, amount_raw):
     """Encode ERC20 approve(address,uint256) calldata."""
-    # approve(address,uint256) selector = 0x095ea7b3
-    spender_padded = spender.lower().replace("0x", "").zfill(64)
-    amount_hex = hex(amount_raw)[2:].zfill(64)
-    return f"0x095ea7b3{spender_padded}{amount_hex}"
+    return encode_call("approve(address,uint256)", [spender, amount_raw])
+
+
+def encode_allowance(owner, spender):
+    """Encode ERC20 allowance(address,address) calldata."""
+    return encode_call("allowance(address,address)", [owner, spender])
 
 
 def encode_bet(token, amount_raw, position):
     """Encode bet(address,uint256,uint8) calldata."""
-    # bet(address,uint256,uint8) selector = 0x37a02e62
-    token_padded = token.lower().replace("0x", "").zfill(64)
-    amount_hex = hex(amount_raw)[2:].zfill(64)
-    position_hex = hex(position)[2:].zfill(64)
-    return f"0x37a02e62{token_padded}{amount_hex}{position_hex}"
+    return encode_call("bet(address,uint256,uint8)", [token, amount_raw, position])
 
 
 def encode_claim(token, epochs):
     """Encode claim(address,uint256[]) calldata."""
-    # claim(address,uint256[]) selector = 0x45718278
-    token_padded = token.lower().replace("0x", "").zfill(64)
-    # ABI encode dynamic array: offset, length, elements
-    offset_hex = hex(64)[2:].zfill(64)  # offset to array data (2 * 32 bytes)
-    length_hex = hex(len(epochs))[2:].zfill(64)
-    elements = "".join(hex(e)[2:].zfill(64) for e in epochs)
-    return f"0x45718278{token_padded}{offset_hex}{length_hex}{elements}"
+    return encode_call("claim(address,uint256[])", [token, epochs])
 
 
 def encode_claimable(token, epoch, user):
     """Encode claimable(address,uint256,address) calldata."""
-    # claimable(address,uint256,address) selector = 0xd3c035fc
-    token_padded = token.lower().replace("0x", "").zfill(64)
-    epoch_hex = hex(epoch)[2:].zfill(64)
-    user_padded = user.lower().replace("0x", "").zfill(64)
-    return f"0xd3c035fc{token_padded}{epoch_hex}{user_padded}"
+    return encode_call("claimable(address,uint256,address)", [token, epoch, user])
 
 
 # -- Commands ----------------------------------------------------------------
 
 def cmd_list(status="open"):
     """List markets filtered by status."""
-    markets = fetch_markets()
-    if status != "all":
-        markets = [m for m in markets if m["status"] == status]
+    markets = market_index().with_status(status)
 
     if not markets:
         print(f"No {status} markets found.")
@@ -184,37 +606,55 @@ def cmd_list(status="open"):
         print(f"${m['symbol']:<9} ${m['poolUsdc']:>9.2f} {bull:>4}% {bear:>4}% {m['status']:<10} {time_left}")
 
 
-def cmd_odds(symbol):
-    """Show odds for a market."""
-    market = find_market(symbol)
-    if not market:
-        print(f"No market found for '{symbol}'")
-        sys.exit(1)
+def cmd_odds(*symbols):
+    """Show odds for one or more markets."""
+    index = market_index()
+    missing = False
+    for i, (symbol, market) in enumerate(index.resolve_many(symbols)):
+        if i:
+            print()
+        if not market:
+            print_market_not_found(index, symbol)
+            missing = True
+            continue
 
-    bull = round(market["bullPct"])
-    bear = 100 - bull
-    time_info = f"{market['secondsToLock']}s to lock" if market.get("secondsToLock") and market["secondsToLock"] > 0 else market["status"]
+        bull = round(market["bullPct"])
+        bear = 100 - bull
+        time_info = f"{market['secondsToLock']}s to lock" if market.get("secondsToLock") and market["secondsToLock"] > 0 else market["status"]
 
-    print(f"${market['symbol']} — Epoch {market['epoch']}")
-    print(f"  UP:   {bull}%")
-    print(f"  DOWN: {bear}%")
-    print(f"  Pool: ${market['poolUsdc']:.2f} USDC")
-    print(f"  {time_info}")
+        print(f"${market['symbol']} — Epoch {market['epoch']}")
+        print(f"  UP:   {bull}%")
+        print(f"  DOWN: {bear}%")
+        print(f"  Pool: ${market['poolUsdc']:.2f} USDC")
+        print(f"  {time_info}")
+    if missing:
+        sys.exit(1)
 
 
-def cmd_info(symbol):
-    """Detailed market info."""
-    market = find_market(symbol)
-    if not market:
-        print(f"No market found for '{symbol}'")
-        sys.exit(1)
+def cmd_info(*symbols):
+    """Detailed market info. Several symbols print a JSON array."""
+    index = market_index()
+    found = []
+    for symbol, market in index.resolve_many(symbols):
+        if not market:
+            print_market_not_found(index, symbol)
+            sys.exit(1)
+        found.append(market)
 
-    print(json.dumps(market, indent=2))
+    print(json.dumps(found[0] if len(found) == 1 else found, indent=2))
 
 
-def cmd_bet(symbol, direction, amount):
+def cmd_bet(*args):
     """Place a bet."""
-    market = find_market(symbol)
+    args = list(args)
+    approve_budget = pop_option(args, "--approve-budget", os.environ.get("AGENTICBETS_APPROVE_BUDGET", "0"))
+    if len(args) < 3:
+        print("Usage: bet <symbol> <up|down> <amount> [--approve-budget USDC]")
+        return
+    symbol, direction, amount = args[:3]
+
+    # Never bet off a cached snapshot: status and secondsToLock must be live.
+    market = find_market(symbol, fresh=True)
     if not market:
         print(f"No market found for '{symbol}'")
         sys.exit(1)
@@ -223,19 +663,36 @@ def cmd_bet(symbol, direction, amount):
     prediction = get_prediction_contract(token)
     position = 0 if direction.lower() in ("up", "bull") else 1
     direction_label = "UP" if position == 0 else "DOWN"
-    amount_raw = int(float(amount) * (10 ** USDC_DECIMALS))
+    try:
+        amount_raw = parse_usdc(amount)
+        budget_raw = parse_usdc(approve_budget)
+    except ValueError as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        sys.exit(1)
 
     print(f"Placing ${amount} {direction_label} bet on ${market['symbol']}...")
 
-    # 1. Approve USDC for this bet amount
-    print("  Approving USDC...")
-    approve_data = encode_approve(prediction, amount_raw)
-    approve_hash = submit_tx(
-        USDC_ADDRESS,
-        approve_data,
-        description=f"Approve ${amount} USDC for AgenticBets {market['symbol']} bet",
-    )
-    print(f"  Approve tx: https://basescan.org/tx/{approve_hash}")
+    # 1. Approve USDC, unless the current allowance already covers the bet
+    wallet = get_wallet_address()
+    allowance = read_allowance(wallet, prediction)
+    if allowance >= amount_raw:
+        print(f"  Existing allowance ${allowance / 10 ** USDC_DECIMALS:.2f} USDC covers this bet — skipping approve.")
+    else:
+        # With a budget, approve it once and spend it down over later bets.
+        approve_raw = max(amount_raw, budget_raw)
+        approve_label = f"{approve_raw / 10 ** USDC_DECIMALS:g}"
+        print(f"  Approving ${approve_label} USDC...")
+        approve_data = encode_approve(prediction, approve_raw)
+        approve_hash = submit_tx(
+            USDC_ADDRESS,
+            approve_data,
+            description=f"Approve ${approve_label} USDC for AgenticBets {market['symbol']} bet",
+        )
+        print(f"  Approve tx: https://basescan.org/tx/{approve_hash}")
+        if not approve_succeeded(approve_hash):
+            print("  Bet not placed.", file=sys.stderr)
+            sys.exit(1)
+        allowance = approve_raw
 
     # 2. Place bet
     print("  Submitting bet...")
@@ -245,6 +702,7 @@ def cmd_bet(symbol, direction, amount):
         bet_data,
         description=f"Place ${amount} {direction_label} bet on {market['symbol']} epoch {market['epoch']}",
     )
+    store_allowance(wallet, prediction, allowance - amount_raw)
     print(f"  Bet tx: https://basescan.org/tx/{bet_hash}")
     print(f"  Done! ${amount} {direction_label} on ${market['symbol']} epoch {market['epoch']}")
 
@@ -280,38 +738,452 @@ def cmd_claimable(symbol, epoch):
 
     wallet = get_wallet_address()
     token = market["token"]
+    prediction = get_prediction_contract(token)
 
     print(f"Checking claimable: ${market['symbol']} epoch {epoch} for {wallet}")
-    print("(Use the AgenticBets website to check — contract reads via Bankr API coming soon)")
+    if decode_uint(eth_call(prediction, encode_claimable(token, epoch, wallet))):
+        print(f"  Epoch {epoch} is claimable. Claim with: claim {market['symbol']} {epoch}")
+    else:
+        print(f"  Epoch {epoch} is not claimable.")
+
+
+def find_claimable_epochs(markets, wallet, since=1):
+    """Return {token: [epochs]} of every claimable epoch, via batched eth_calls.
+
+    Scans epochs `since`..current for each market; all markets share one
+    sequence of JSON-RPC batches rather than one request per epoch.
+    """
+    calls = []
+    keys = []
+    for m in markets:
+        token = m["token"]
+        prediction = get_prediction_contract(token)
+        for epoch in range(since, int(m["epoch"]) + 1):
+            calls.append(("eth_call", [{"to": prediction, "data": encode_claimable(token, epoch, wallet)}, "latest"]))
+            keys.append((token, epoch))
+
+    claimable = {}
+    for (token, epoch), result in zip(keys, rpc_batch(calls)):
+        if decode_uint(result):
+            claimable.setdefault(token, []).append(epoch)
+    return claimable
+
+
+def plan_claims(token, epochs, wallet, max_gas=DEFAULT_CLAIM_MAX_GAS):
+    """Split epochs into claim() calls that each fit under max_gas; returns [(epochs, gas)].
+
+    The first split uses the CLAIM_*_GAS guesses. Each planned claim is then
+    checked with eth_estimateGas (all in one JSON-RPC batch per round), and
+    one that is over max_gas, or whose estimate fails, is halved and checked
+    again. An epoch that cannot be estimated on its own would revert and is
+    skipped with a warning.
+    """
+    prediction = get_prediction_contract(token)
+    per_tx = max(1, (max_gas - CLAIM_BASE_GAS) // CLAIM_GAS_PER_EPOCH)
+    batches = [epochs[i:i + per_tx] for i in range(0, len(epochs), per_tx)]
+    plan = []
+    while batches:
+        calls = [("eth_estimateGas", [{"from": wallet, "to": prediction, "data": encode_claim(token, batch)}])
+                 for batch in batches]
+        again = []
+        for batch, result in zip(batches, rpc_batch(calls, allow_errors=True)):
+            gas = decode_uint(result) if isinstance(result, str) else None
+            if gas is not None and gas <= max_gas:
+                plan.append((batch, gas))
+            elif len(batch) > 1:
+                half = len(batch) // 2
+                again += [batch[:half], batch[half:]]
+            elif gas is not None:
+                print(f"ERROR: --max-gas {max_gas} is too low: claiming epoch {batch[0]} alone "
+                      f"needs {gas:,} gas", file=sys.stderr)
+                sys.exit(1)
+            else:
+                error = result["error"]
+                print(f"  WARNING: skipping epoch {batch[0]}: gas estimate failed, the claim would likely "
+                      f"revert — {error.get('message', error) if isinstance(error, dict) else error}",
+                      file=sys.stderr)
+        batches = again
+    return sorted(plan, key=lambda p: p[0][0])
+
+
+def pop_option(args, name, default=None):
+    """Remove `name <value>` from args and return the value (or default)."""
+    if name not in args:
+        return default
+    i = args.index(name)
+    if i + 1 >= len(args):
+        print(f"ERROR: {name} needs a value", file=sys.stderr)
+        sys.exit(1)
+    value = args[i + 1]
+    del args[i:i + 2]
+    return value
+
+
+def cmd_claim_all(*args):
+    """Find and claim every claimable epoch across markets."""
+    args = list(args)
+    dry_run = "--dry-run" in args
+    if dry_run:
+        args.remove("--dry-run")
+    max_gas = int(pop_option(args, "--max-gas", DEFAULT_CLAIM_MAX_GAS))
+    since = int(pop_option(args, "--since", 1))
+
+    index = market_index()
+    if args:
+        markets = []
+        for symbol, market in index.resolve_many(args):
+            if not market:
+                print_market_not_found(index, symbol)
+                sys.exit(1)
+            markets.append(market)
+    else:
+        markets = index.markets
+
+    wallet = get_wallet_address()
+    print(f"Scanning {len(markets)} market(s) from epoch {since} for {wallet}...")
+    claimable = find_claimable_epochs(markets, wallet, since)
+    if not claimable:
+        print("Nothing to claim.")
+        return
+
+    plan = []
+    for m in markets:
+        for batch, gas in plan_claims(m["token"], claimable.get(m["token"], []), wallet, max_gas):
+            plan.append((m, batch, gas))
+
+    print(f"Claim plan: {len(plan)} transaction(s)")
+    for m, batch, gas in plan:
+        print(f"  ${m['symbol']:<9} {len(batch):>4} epoch(s) ~{gas:,} gas (estimated)  {batch}")
+    if dry_run:
+        print("Dry run — nothing submitted.")
+        return
+
+    for m, batch, _ in plan:
+        token = m["token"]
+        tx_hash = submit_tx(
+            get_prediction_contract(token),
+            encode_claim(token, batch),
+            description=f"Claim {m['symbol']} winnings for {len(batch)} epoch(s) ({batch[0]}–{batch[-1]})",
+        )
+        print(f"  ${m['symbol']} claim tx: https://basescan.org/tx/{tx_hash}")
+    print("  Done!")
+
+
+def read_bet_rows(path):
+    """Read (symbol, direction, amount) rows from a CSV (with header) or JSONL file.
+
+    A JSONL line that is not a JSON object comes back with an "error" key
+    instead of failing the whole file.
+    """
+    f = sys.stdin if path == "-" else open(path, newline="")
+    with f:
+        text = f.read()
+    if path.endswith(".csv"):
+        rows = list(csv.DictReader(text.splitlines()))
+    else:
+        rows = []
+        for line in text.splitlines():
+            if not line.strip():
+                continue
+            try:
+                rows.append(json.loads(line))
+            except ValueError as e:
+                rows.append(f"invalid JSON: {e}")
+    parsed = []
+    for i, r in enumerate(rows, 1):
+        if not isinstance(r, dict):
+            error = r if isinstance(r, str) else "row is not a JSON object"
+            parsed.append({"row": i, "symbol": "", "direction": "", "amount": "", "error": error})
+            continue
+        parsed.append({"row": i, "symbol": str(r.get("symbol", "")).strip(),
+                       "direction": str(r.get("direction", "")).strip().lower(),
+                       "amount": str(r.get("amount", "")).strip()})
+    return parsed
+
+
+def seconds_to_lock(market, fetched_at):
+    """Live seconds until lock, or None when the round has no lock pending."""
+    if market.get("lockTimestamp") and market.get("secondsToLock") is not None:
+        return market["lockTimestamp"] - time.time()
+    if market.get("secondsToLock") is None:
+        return None
+    return market["secondsToLock"] - (time.time() - fetched_at)
+
+
+def lock_closing(market, fetched_at, min_lock):
+    """True if the market's betting window closes within min_lock seconds."""
+    remaining = seconds_to_lock(market, fetched_at)
+    return remaining is not None and remaining <= min_lock
+
+
+def cmd_bet_batch(*args):
+    """Place many bets from a CSV/JSONL file, several in flight at once."""
+    args = list(args)
+    max_in_flight = int(pop_option(args, "--max-in-flight", 4))
+    min_lock = float(pop_option(args, "--min-lock", 10))
+    approve_budget = pop_option(args, "--approve-budget", os.environ.get("AGENTICBETS_APPROVE_BUDGET", "0"))
+    if not args:
+        print("Usage: bet-batch <file.jsonl|file.csv|-> [--max-in-flight N] [--min-lock S] [--approve-budget USDC]")
+        return
+
+    print_lock = threading.Lock()
+    final = {}  # row number -> its last emitted result, for the summary
+
+    def emit(row, **result):
+        with print_lock:
+            final[row["row"]] = {"symbol": row["symbol"], **result}
+            print(json.dumps({"row": row["row"], "symbol": row["symbol"], **result}), flush=True)
+
+    def print_summary():
+        """Every row's final status, on stderr."""
+        counts = {}
+        for result in final.values():
+            counts[result["status"]] = counts.get(result["status"], 0) + 1
+        print(f"Batch: {len(final)} row(s) — " + ", ".join(f"{n} {status}" for status, n in sorted(counts.items())),
+              file=sys.stderr)
+        for number, result in sorted(final.items()):
+            detail = result.get("tx") or result.get("error") or ""
+            if result.get("tx") and result.get("error"):
+                detail += f" ({result['error']})"
+            print(f"  row {number:>4}  {result['symbol']:<9} {result['status']:<11} {detail}", file=sys.stderr)
+
+    # Resolve every row against one fresh market fetch.
+    index = market_index(fresh=True)
+    fetched_at = time.time()
+    pending = []
+    for row in read_bet_rows(args[0]):
+        market = index.get(row["symbol"]) if row["symbol"] else None
+        try:
+            amount_raw = parse_usdc(row["amount"])
+        except ValueError:
+            amount_raw = 0
+        if "error" in row:
+            emit(row, status="rejected", error=row["error"])
+        elif not market:
+            emit(row, status="rejected", error="no such market")
+        elif row["direction"] not in ("up", "bull", "down", "bear"):
+            emit(row, status="rejected", error=f"bad direction {row['direction']!r}")
+        elif amount_raw <= 0:
+            emit(row, status="rejected", error=f"bad amount {row['amount']!r}")
+        elif amount_raw < MIN_BET_RAW:
+            emit(row, status="rejected", error=f"amount {row['amount']} is below the 1 USDC minimum bet")
+        elif market["status"] not in BETTABLE_STATUSES:
+            emit(row, status="rejected", error=f"market is {market['status']}")
+        elif lock_closing(market, fetched_at, min_lock):
+            emit(row, status="rejected", error="lock window closed")
+        else:
+            pending.append((row, market, amount_raw))
+    if not pending:
+        print_summary()
+        return
+
+    try:
+        budget_raw = parse_usdc(approve_budget)
+    except ValueError as e:
+        print(f"ERROR: --approve-budget: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    # One approve per prediction contract, confirmed before any bet is sent.
+    # Without the allowance every bet would revert, so any failure here stops
+    # the batch before the first bet.
+    needed = {}
+    for _, market, amount_raw in pending:
+        prediction = get_prediction_contract(market["token"])
+        needed[prediction] = needed.get(prediction, 0) + amount_raw
+    allowances = {}
+    try:
+        wallet = get_wallet_address()
+        for prediction, total in needed.items():
+            allowance = read_allowance(wallet, prediction, fresh=True)
+            if allowance < total:
+                approve_raw = max(total, budget_raw)
+                approve_hash = submit_tx(
+                    USDC_ADDRESS,
+                    encode_approve(prediction, approve_raw),
+                    description=f"Approve ${approve_raw / 10 ** USDC_DECIMALS:g} USDC for {len(pending)} AgenticBets bets",
+                )
+                print(f"  Approve tx: https://basescan.org/tx/{approve_hash}", file=sys.stderr)
+                if not approve_succeeded(approve_hash):
+                    raise RequestError(f"USDC approve {approve_hash} failed")
+                allowance = approve_raw
+            allowances[prediction] = allowance
+    except RequestError as e:
+        print(e, file=sys.stderr)
+        for row, _, _ in pending:
+            emit(row, status="not_sent", error=f"{e}; batch aborted before any bet")
+        print_summary()
+        sys.exit(1)
+
+    # Bets are submitted one at a time from this thread so Bankr assigns
+    # nonces in row order; only the confirmation waits run concurrently.
+    in_flight = threading.BoundedSemaphore(max_in_flight)
+
+    def confirm(row, tx_hash):
+        try:
+            ok = wait_for_receipt(tx_hash)
+            emit(row, status="confirmed" if ok else "reverted", tx=tx_hash)
+        except (TimeoutError, RequestError) as e:
+            emit(row, status="unconfirmed", tx=tx_hash, error=str(e) or "receipt lookup failed")
+        finally:
+            in_flight.release()
+
+    failed = None
+    with ThreadPoolExecutor(max_workers=max_in_flight) as pool:
+        futures = []
+        for row, market, amount_raw in pending:
+            if failed is not None:
+                emit(row, status="not_sent", error=f"batch stopped after row {failed} failed")
+                continue
+            in_flight.acquire()
+            if lock_closing(market, fetched_at, min_lock):
+                in_flight.release()
+                emit(row, status="rejected", error="lock window closed before submission")
+                continue
+            token = market["token"]
+            prediction = get_prediction_contract(token)
+            position = 0 if row["direction"] in ("up", "bull") else 1
+            label = "UP" if position == 0 else "DOWN"
+            try:
+                tx_hash = submit_tx(
+                    prediction,
+                    encode_bet(token, amount_raw, position),
+                    description=f"Place ${row['amount']} {label} bet on {market['symbol']} epoch {market['epoch']}",
+                    wait=False,
+                )
+            except RequestError as e:
+                # Bankr may still have broadcast it, so never resend: stop and report.
+                in_flight.release()
+                failed = row["row"]
+                emit(row, status="failed", error=f"{e} (check the wallet before retrying this row)")
+                continue
+            allowances[prediction] -= amount_raw
+            emit(row, status="submitted", tx=tx_hash)
+            futures.append(pool.submit(confirm, row, tx_hash))
+        for future in as_completed(futures):
+            future.result()
+
+    for prediction, allowance in allowances.items():
+        store_allowance(wallet, prediction, allowance)
+    print_summary()
+    if failed is not None:
+        sys.exit(1)
+
+
+# Fields whose change is reported by `watch`; secondsToLock ticks every poll.
+WATCH_FIELDS = ("status", "epoch", "poolUsdc", "bullPct")
+
+
+def diff_markets(previous, markets, symbols=None):
+    """Yield (market, changes) for markets that differ from `previous`.
+
+    `previous` maps token -> tuple of WATCH_FIELDS and is updated in place.
+    Unchanged markets cost one tuple comparison.
+    """
+    for m in markets:
+        if symbols and m["symbol"].lower() not in symbols and m["token"].lower() not in symbols:
+            continue
+        current = tuple(m.get(f) for f in WATCH_FIELDS)
+        before = previous.get(m["token"])
+        if before == current:
+            continue
+        previous[m["token"]] = current
+        if before is None:
+            yield m, {f: [None, v] for f, v in zip(WATCH_FIELDS, current)}
+        else:
+            yield m, {f: [old, new] for f, old, new in zip(WATCH_FIELDS, before, current) if old != new}
+
+
+def next_poll_delay(markets, interval, min_interval):
+    """Poll every `interval` seconds, tightening as the nearest lock approaches."""
+    locks = [m["secondsToLock"] for m in markets if m.get("secondsToLock")]
+    if not locks:
+        return interval
+    return max(min_interval, min(interval, min(locks) / 2))
+
+
+def cmd_watch(*args):
+    """Stream market changes as JSON lines until interrupted."""
+    args = list(args)
+    interval = float(pop_option(args, "--interval", 30))
+    min_interval = float(pop_option(args, "--min-interval", 10))
+    count = int(pop_option(args, "--count", 0))
+    symbols = {a.lower().lstrip("$") for a in args}
+
+    previous = {}
+    snapshot = None
+    ticks = 0
+    try:
+        while True:
+            snapshot, modified = revalidate_markets(snapshot)
+            markets = refresh_time_fields(snapshot["markets"], snapshot["fetchedAt"])
+            if modified:
+                now = int(time.time())
+                for m, changes in diff_markets(previous, markets, symbols):
+                    print(json.dumps({
+                        "ts": now,
+                        "symbol": m["symbol"],
+                        "token": m["token"],
+                        "secondsToLock": m.get("secondsToLock"),
+                        "changes": changes,
+                    }), flush=True)
+            ticks += 1
+            if count and ticks >= count:
+                return
+            time.sleep(next_poll_delay(markets, interval, min_interval))
+    except KeyboardInterrupt:
+        pass
 
 
 # -- Entry point -------------------------------------------------------------
 
 COMMANDS = {
     "list": lambda args: cmd_list(args[0] if args else "open"),
-    "odds": lambda args: cmd_odds(args[0]) if args else print("Usage: odds <symbol>"),
-    "info": lambda args: cmd_info(args[0]) if args else print("Usage: info <symbol>"),
-    "bet": lambda args: cmd_bet(args[0], args[1], args[2]) if len(args) >= 3 else print("Usage: bet <symbol> <up|down> <amount>"),
+    "odds": lambda args: cmd_odds(*args) if args else print("Usage: odds <symbol> [symbol...]"),
+    "info": lambda args: cmd_info(*args) if args else print("Usage: info <symbol> [symbol...]"),
+    "bet": lambda args: cmd_bet(*args),
     "claim": lambda args: cmd_claim(args[0], *args[1:]) if len(args) >= 2 else print("Usage: claim <symbol> <epoch> [epoch...]"),
     "claimable": lambda args: cmd_claimable(args[0], int(args[1])) if len(args) >= 2 else print("Usage: claimable <symbol> <epoch>"),
+    "claim-all": lambda args: cmd_claim_all(*args),
+    "bet-batch": lambda args: cmd_bet_batch(*args),
+    "watch": lambda args: cmd_watch(*args),
 }
 
+GLOBAL_FLAGS = ("--fresh", "--stats")
+
+
 def main():
     if len(sys.argv) < 2 or sys.argv[1] not in COMMANDS:
         print("AgenticBets — Prediction markets on Base")
         print()
         print("Commands:")
         print("  list [status]              List markets (open/locked/settled/all)")
-        print("  odds <symbol>              Show bull/bear odds")
-        print("  info <symbol>              Detailed market info (JSON)")
-        print("  bet <symbol> <up|down> <$> Place a USDC bet")
+        print("  odds <symbol...>           Show bull/bear odds")
+        print("  info <symbol...>           Detailed market info (JSON)")
+        print("  watch [symbol...]          Stream market changes as JSON lines (--interval S, --min-interval S)")
+        print("  bet <symbol> <up|down> <$> Place a USDC bet (--approve-budget USDC)")
+        print("  bet-batch <file>           Place bets from CSV/JSONL rows (--max-in-flight N, --min-lock S)")
         print("  claim <symbol> <epoch...>  Claim settled winnings")
         print("  claimable <symbol> <epoch> Check if epoch is claimable")
+        print("  claim-all [symbol...]      Claim every claimable epoch (--since N, --max-gas G, --dry-run);")
+        print("                             each claim tx is checked with eth_estimateGas against --max-gas")
+        print()
+        print("Options:")
+        print("  --fresh                    Bypass the local market snapshot cache")
+        print("  --stats                    Report HTTP connection reuse on exit")
         sys.exit(0)
 
+    global FORCE_FRESH
     cmd = sys.argv[1]
     args = sys.argv[2:]
-    COMMANDS[cmd](args)
+    FORCE_FRESH = "--fresh" in args
+    if "--stats" in args:
+        atexit.register(print_http_stats)
+    args = [a for a in args if a not in GLOBAL_FLAGS]
+    try:
+        COMMANDS[cmd](args)
+    except RequestError as e:
+        print(e, file=sys.stderr)
+        sys.exit(1)
 
 
 if __name__ == "__main__":
@@ -16,18 +16,47 @@ challenge is refused before anything is signed. The pins are env-overridable
     python query.py "What is the Clanker Ecosystem Fund?"
 
 Networks: Base mainnet = eip155:8453 (real USDC) | Base Sepolia = eip155:84532 (test USDC).
+
+Answers are cached locally by normalized question text, so asking the same
+thing again within GMFARCASTER_CACHE_TTL (default 24h) costs nothing. Pass
+--no-cache to always pay for a fresh answer.
+
+Batch mode answers many questions with one x402 client and HTTP session:
+
+    python query.py --batch questions.txt --concurrency 4 --budget 0.50 > answers.jsonl
+
+Questions are read one per line (or `-` for stdin), asked concurrently, and
+written as JSONL in completion order. The batch never commits more than
+--budget USDC: each request reserves the max pinned price before it is sent
+(twice that when it carries a pre-signed payment).
+
+--presign (or GMFARCASTER_PRESIGN=1) saves a round trip per query: the last
+402 challenge that passed the pins is cached, and the next request carries a
+payment signed against it up front. The cached challenge goes through the same
+payment policies before signing; if the server rejects the payment (price or
+payee changed), the normal 402 flow takes over; the rejected authorization can
+still be settled, so both payments count as spent.
+
+--stream asks for Server-Sent Events and prints answer text as it arrives,
+then the citations, and reports time-to-first-token and total latency on
+stderr (--timings reports the same for the buffered path). A server that
+answers with plain JSON is handled as if buffered.
 """
+import argparse
+import hashlib
+import json
 import os
+import re
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from decimal import Decimal, InvalidOperation
 
-import requests
-from eth_account import Account
-from x402 import NoMatchingRequirementsError, x402ClientSync
-from x402.mechanisms.evm.exact.client import ExactEvmScheme
-from x402.mechanisms.evm.signers import EthAccountSigner
-from x402.http.clients.requests import PaymentError as X402HttpPaymentError
-from x402.http.clients.requests import x402_requests
+# requests, eth_account and x402 are imported inside the functions that pay,
+# so usage errors, the endpoint guard and cached answers start without them
+# (~80 ms instead of ~1 s). Check with `python -X importtime query.py 2>&1 |
+# grep -E "eth_account|x402|requests"`: the no-payment paths must print nothing.
 
 DEFAULT_API_URL = "https://api.gmfarcaster.com/v1/query"
 API_URL = os.environ.get("GMFARCASTER_API_URL", DEFAULT_API_URL)
@@ -51,6 +80,18 @@ EXPECTED_PAYEES = [
 ]
 MAX_PRICE_USDC = os.environ.get("GMFARCASTER_MAX_PRICE", "0.005")
 
+# --- Answer cache -------------------------------------------------------------
+CACHE_DIR = os.environ.get("GMFARCASTER_CACHE_DIR", os.path.expanduser("~/.cache/gmfarcaster"))
+CACHE_FILE = os.path.join(CACHE_DIR, "answers.json")
+CACHE_TTL = float(os.environ.get("GMFARCASTER_CACHE_TTL", str(24 * 3600)))
+CACHE_MAX_ENTRIES = int(os.environ.get("GMFARCASTER_CACHE_MAX", "500"))
+
+DEFAULT_BATCH_BUDGET = os.environ.get("GMFARCASTER_BATCH_BUDGET", "0.50")
+DEFAULT_BATCH_CONCURRENCY = 4
+
+PRESIGN = os.environ.get("GMFARCASTER_PRESIGN") == "1"
+CHALLENGE_TTL = float(os.environ.get("GMFARCASTER_CHALLENGE_TTL", "3600"))
+
 
 def _max_amount_atomic() -> int:
     try:
@@ -82,6 +123,98 @@ def pinned_payment_policy(version, reqs):
     ]
 
 
+class QueryError(Exception):
+    """A query failed; the message is ready to show the user."""
+
+
+class SpendBudget:
+    """Total USDC a batch may spend, shared by concurrent requests.
+
+    A request reserves the max pinned price before it is sent (the real price
+    is only known from the 402 challenge) and settles to what it actually paid
+    afterwards, so in-flight requests can never jointly overshoot the budget.
+    """
+
+    def __init__(self, limit_atomic: int):
+        self.limit = limit_atomic
+        self.committed = 0  # paid + reserved
+        self.spent = 0
+        self.lock = threading.Lock()
+
+    def reserve(self, amount: int) -> bool:
+        with self.lock:
+            if self.committed + amount > self.limit:
+                return False
+            self.committed += amount
+            return True
+
+    def settle(self, reserved: int, paid: int) -> None:
+        with self.lock:
+            self.committed += paid - reserved
+            self.spent += paid
+
+
+# Per-thread payment state for the request in flight on that thread: the most
+# this request may sign for in total (budget_policy), and from the after-payment
+# hook what it signed for, how many payloads it signed and the last challenge
+# it signed against.
+_payment = threading.local()
+
+
+def budget_policy(version, reqs):
+    """x402 payment policy layered after the pins: stay within this request's reservation.
+
+    Payloads already signed for the request count against it, so a fallback
+    after a rejected pre-signed payment only gets what is left.
+    """
+    allowance = getattr(_payment, "allowance", None)
+    if allowance is None:
+        return reqs
+    left = allowance - getattr(_payment, "paid", 0)
+    return [r for r in reqs if int(r.get_amount()) <= left]
+
+
+def _record_payment(ctx) -> None:
+    # Every signed payload counts: a pre-signed EIP-3009 authorization the
+    # server rejected is still valid until it expires and can be settled by
+    # anyone holding it, on top of the payment from the normal 402 flow.
+    _payment.paid += int(ctx.selected_requirements.get_amount())
+    _payment.signatures += 1
+    _payment.challenge = ctx.payment_required
+
+
+def payment_reservation(presigning: bool) -> int:
+    """Most a question may sign for: one payload, or two when pre-signing.
+
+    A pre-signed payment the server rejects is followed by a second one from
+    the 402 flow, and both authorizations can settle.
+    """
+    return MAX_AMOUNT_ATOMIC * (2 if presigning else 1)
+
+
+def load_challenge(cache: dict):
+    """The cached 402 challenge for this endpoint, or None if absent or stale."""
+    saved = cache.get("challenge")
+    if not saved or saved["api_url"] != API_URL or time.time() - saved["ts"] > CHALLENGE_TTL:
+        return None
+    from x402 import PaymentRequired, PaymentRequiredV1
+
+    data = saved["payment_required"]
+    model = PaymentRequiredV1 if data.get("x402Version") == 1 else PaymentRequired
+    try:
+        return model.model_validate(data)
+    except ValueError:
+        return None
+
+
+def remember_challenge(cache: dict, challenge) -> None:
+    cache["challenge"] = {
+        "api_url": API_URL,
+        "ts": time.time(),
+        "payment_required": challenge.model_dump(mode="json", by_alias=True, exclude_none=True),
+    }
+
+
 def _pin_refusal_message() -> str:
     return (
         "REFUSED TO PAY: the API's 402 challenge did not match this script's payment pins "
@@ -94,6 +227,88 @@ def _pin_refusal_message() -> str:
     )
 
 
+def normalize_query(query: str) -> str:
+    """Case-, whitespace- and trailing-punctuation-insensitive form of a question."""
+    return re.sub(r"\s+", " ", query).strip().rstrip("?!. ").casefold()
+
+
+def cache_key(query: str) -> str:
+    # The endpoint is part of the key: a testnet deployment answers differently.
+    return hashlib.sha256(f"{API_URL}\n{normalize_query(query)}".encode()).hexdigest()
+
+
+def load_cache() -> dict:
+    try:
+        with open(CACHE_FILE) as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        cache = {}
+    cache.setdefault("entries", {})
+    cache.setdefault("stats", {"hits": 0, "saved_usdc": "0", "saved_seconds": 0.0})
+    return cache
+
+
+def save_cache(cache: dict) -> None:
+    """Drop expired entries, cap the size (oldest first) and write atomically."""
+    now = time.time()
+    entries = {k: e for k, e in cache["entries"].items() if now - e["ts"] <= CACHE_TTL}
+    if len(entries) > CACHE_MAX_ENTRIES:
+        newest = sorted(entries, key=lambda k: entries[k]["ts"])[-CACHE_MAX_ENTRIES:]
+        entries = {k: entries[k] for k in newest}
+    cache["entries"] = entries
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp = f"{CACHE_FILE}.{os.getpid()}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(cache, f)
+        os.replace(tmp, CACHE_FILE)
+    except OSError as e:
+        print(f"NOTE: could not write answer cache: {e}", file=sys.stderr)
+
+
+def cached_answer(cache: dict, query: str) -> dict | None:
+    entry = cache["entries"].get(cache_key(query))
+    if entry is None or time.time() - entry["ts"] > CACHE_TTL:
+        return None
+    return entry
+
+
+def record_hit(cache: dict, entry: dict, quiet: bool = False) -> None:
+    """Count a cache hit and report what it saved, per hit and in total.
+
+    Batch mode passes quiet=True and saves the cache once at the end.
+    """
+    stats = cache["stats"]
+    stats["hits"] += 1
+    stats["saved_usdc"] = str(Decimal(stats["saved_usdc"]) + Decimal(entry["paid_usdc"]))
+    stats["saved_seconds"] += entry["latency"]
+    if quiet:
+        return
+    save_cache(cache)
+    age = time.time() - entry["ts"]
+    print(
+        f"NOTE: cached answer from {age / 60:.0f} min ago — saved {entry['paid_usdc']} USDC "
+        f"and ~{entry['latency']:.1f}s (total over {stats['hits']} hits: "
+        f"{stats['saved_usdc']} USDC, {stats['saved_seconds']:.1f}s). Use --no-cache to pay for a fresh answer.",
+        file=sys.stderr,
+    )
+
+
+def print_answer(data: dict) -> None:
+    print(data.get("answer", "(no answer returned)"))
+    print_citations(data)
+
+
+def print_citations(data: dict) -> None:
+    citations = data.get("citations") or []
+    if citations:
+        print("\nSources:")
+        for c in citations:
+            label = c.get("title") or c.get("display_name") or c.get("episode") or "source"
+            url = c.get("url", "")
+            print(f"- {label}: {url}".rstrip())
+
+
 def load_private_key() -> str:
     key_file = os.environ.get("GMFARCASTER_PRIVATE_KEY_FILE")
     if key_file:
@@ -131,49 +346,345 @@ def guard_custom_endpoint() -> None:
     )
 
 
-def main() -> None:
-    query = " ".join(sys.argv[1:]).strip()
-    if not query:
-        sys.exit('Usage: python query.py "<your question about the GM Farcaster archive>"')
+def build_session():
+    """One x402 client + HTTP session, reusable across (concurrent) queries.
+
+    Returns (session, presign) where presign(challenge) signs a payment for a
+    cached challenge and returns the header to send with the first request.
+    """
+    from eth_account import Account
+    from x402 import x402ClientSync
+    from x402.http import x402HTTPClientSync
+    from x402.http.clients.requests import x402_requests
+    from x402.mechanisms.evm.exact.client import ExactEvmScheme
+    from x402.mechanisms.evm.signers import EthAccountSigner
 
-    guard_custom_endpoint()
     key = load_private_key()
 
     account = Account.from_key(key)
     client = x402ClientSync()
     client.register(NETWORK, ExactEvmScheme(EthAccountSigner(account)))
     client.register_policy(pinned_payment_policy)
-    session = x402_requests(client)  # auto-handles 402 -> validate pins -> pay -> retry
+    client.register_policy(budget_policy)
+    client.on_after_payment_creation(_record_payment)
+    http_client = x402HTTPClientSync(client)
+
+    def presign(challenge) -> dict:
+        return http_client.encode_payment_signature_header(client.create_payment_payload(challenge))
 
+    return x402_requests(client), presign  # session auto-handles 402 -> validate pins -> pay -> retry
+
+
+def _sse_events(resp):
+    """Yield (event, data) pairs from a text/event-stream response."""
+    event, data = "message", []
+    for line in resp.iter_lines(decode_unicode=True):
+        if not line:
+            if data:
+                yield event, "\n".join(data)
+            event, data = "message", []
+        elif line.startswith("event:"):
+            event = line[6:].strip()
+        elif line.startswith("data:"):
+            data.append(line[5:].removeprefix(" "))
+    if data:
+        yield event, "\n".join(data)
+
+
+def read_stream(resp, on_text) -> dict:
+    """Consume a streamed answer, passing text to on_text as it arrives.
+
+    SSE events may carry plain text or JSON with a "delta"/"token"/"text"
+    fragment, a complete "answer" and/or "citations"; "[DONE]" or an
+    "error" event ends the stream. Returns {"answer", "citations"} like the
+    buffered API. Non-SSE responses are read whole (JSON) or chunk by chunk.
+    """
+    content_type = resp.headers.get("Content-Type", "")
+    if "charset" not in content_type.lower():
+        # requests would decode text/* as ISO-8859-1 and leave other types as
+        # bytes; the API sends UTF-8. Set explicitly, decoding is incremental,
+        # so a character split across chunks is still read whole.
+        resp.encoding = "utf-8"
+    if "text/event-stream" not in content_type:
+        if "json" in content_type:
+            data = resp.json()
+            on_text(data.get("answer", "(no answer returned)"))
+            return data
+        parts = []
+        for chunk in resp.iter_content(chunk_size=None, decode_unicode=True):
+            parts.append(chunk)
+            on_text(chunk)
+        return {"answer": "".join(parts)}
+
+    parts, result = [], {}
+    for event, raw in _sse_events(resp):
+        if raw == "[DONE]":
+            break
+        try:
+            payload = json.loads(raw)
+        except ValueError:
+            payload = raw
+        if event == "error":
+            message = payload.get("error", raw) if isinstance(payload, dict) else raw
+            raise QueryError(f"GM Farcaster API stream failed: {message}")
+        if not isinstance(payload, dict):
+            parts.append(payload)
+            on_text(payload)
+            continue
+        text = payload.get("delta") or payload.get("token") or payload.get("text")
+        if text:
+            parts.append(text)
+            on_text(text)
+        if "answer" in payload and not parts:  # whole answer in one event
+            parts.append(payload["answer"])
+            on_text(payload["answer"])
+        if payload.get("citations"):
+            result["citations"] = payload["citations"]
+    result["answer"] = "".join(parts)
+    return result
+
+
+def ask(session, query: str, allowance: int | None = None,
+        presign=None, challenge=None, on_text=None) -> tuple[dict, int, float]:
+    """POST one question; returns (response JSON, atomic USDC paid, latency).
+
+    allowance caps the total of every payload signed for the question; by
+    default it is the max pinned price per payload that may be signed.
+    With presign and a cached challenge, the first request already carries a
+    payment; the session falls back to the 402 flow if the server rejects it.
+    The paid amount then includes both payments, since either may settle.
+    Afterwards _payment.signatures == 1 means the query took one round trip.
+    With on_text, the answer is requested as a stream and each text fragment
+    is passed to on_text as it arrives.
+    Raises QueryError with a user-facing message on refusal or failure.
+    """
+    import requests
+    from x402 import NoMatchingRequirementsError
+    from x402.http.clients.requests import PaymentError as X402HttpPaymentError
+
+    presigning = presign is not None and challenge is not None
+    _payment.allowance = allowance if allowance is not None else payment_reservation(presigning)
+    _payment.paid = 0
+    _payment.signatures = 0
+    _payment.challenge = None
+    headers = {}
+    if presigning:
+        try:
+            headers = presign(challenge)
+        except NoMatchingRequirementsError:
+            pass  # the cached challenge no longer passes the pins; let the server re-issue one
+    body = {"query": query}
+    if on_text is not None:
+        body["stream"] = True
+        headers = {**headers, "Accept": "text/event-stream, application/json"}
+    started = time.monotonic()
+    resp = None
     try:
-        resp = session.post(API_URL, json={"query": query}, timeout=300)
+        resp = session.post(API_URL, json=body, headers=headers, timeout=300, stream=on_text is not None)
         resp.raise_for_status()
+        data = read_stream(resp, on_text) if on_text is not None else resp.json()
     except NoMatchingRequirementsError:
-        sys.exit(_pin_refusal_message())
+        raise QueryError(_pin_refusal_message()) from None
     except X402HttpPaymentError as e:
         if isinstance(e.__cause__, NoMatchingRequirementsError):
-            sys.exit(_pin_refusal_message())
-        sys.exit(f"Payment handling failed before completion: {e}")
+            raise QueryError(_pin_refusal_message()) from None
+        raise QueryError(f"Payment handling failed before completion: {e}") from None
     except requests.HTTPError:
         status = resp.status_code
         hint = {
             402: "Payment could not be completed — check the wallet holds USDC on Base.",
             400: "The query was rejected (empty or too long).",
         }.get(status, "Please try again shortly.")
-        sys.exit(f"GM Farcaster API request failed (HTTP {status}). {hint}")
+        raise QueryError(f"GM Farcaster API request failed (HTTP {status}). {hint}") from None
     except requests.RequestException as e:
-        sys.exit(f"Could not reach the GM Farcaster API: {type(e).__name__}.")
+        raise QueryError(f"Could not reach the GM Farcaster API: {type(e).__name__}.") from None
+    return data, _payment.paid, time.monotonic() - started
 
-    data = resp.json()
-    print(data.get("answer", "(no answer returned)"))
 
-    citations = data.get("citations") or []
-    if citations:
-        print("\nSources:")
-        for c in citations:
-            label = c.get("title") or c.get("display_name") or c.get("episode") or "source"
-            url = c.get("url", "")
-            print(f"- {label}: {url}".rstrip())
+def store_answer(cache: dict, query: str, data: dict, paid: int, latency: float) -> None:
+    if "answer" in data:
+        cache["entries"][cache_key(query)] = {
+            "answer": data["answer"],
+            "citations": data.get("citations") or [],
+            "ts": time.time(),
+            "latency": latency,
+            "paid_usdc": str(Decimal(paid) / 10**USDC_DECIMALS),
+        }
+
+
+def read_questions(path: str) -> list[str]:
+    """One question per line (blank lines and #-comments skipped); `-` reads stdin.
+
+    Lines that are JSON objects are read as {"query": ...}, so a previous
+    run's JSONL output can be fed back in.
+    """
+    f = sys.stdin if path == "-" else open(path)
+    with f:
+        questions = []
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            if line.startswith("{"):
+                line = str(json.loads(line).get("query", "")).strip()
+            if line:
+                questions.append(line)
+    return questions
+
+
+def run_batch(path: str, concurrency: int, budget_usdc: str, use_cache: bool, presign_payments: bool) -> None:
+    """Answer every question in `path`, streaming JSONL results in completion order."""
+    try:
+        budget = SpendBudget(int(Decimal(budget_usdc) * 10**USDC_DECIMALS))
+    except InvalidOperation:
+        sys.exit(f"--budget is not a valid decimal USDC amount: {budget_usdc!r}")
+
+    questions = read_questions(path)
+    cache = load_cache()
+    cache_lock = threading.Lock()
+    out_lock = threading.Lock()
+    counts = {"ok": 0, "cached": 0, "error": 0, "skipped": 0}
+    round_trips_saved = 0
+    challenge = load_challenge(cache) if presign_payments else None
+
+    def emit(query: str, status: str, **fields) -> None:
+        with out_lock:
+            counts[status] += 1
+            print(json.dumps({"query": query, "status": status, **fields}), flush=True)
+
+    # Ask each distinct (normalized) question once; duplicates share the answer.
+    groups = {}
+    for q in questions:
+        groups.setdefault(cache_key(q), []).append(q)
+
+    to_ask = {}
+    for key, qs in groups.items():
+        entry = cached_answer(cache, qs[0]) if use_cache else None
+        if entry is None:
+            to_ask[key] = qs
+            continue
+        for q in qs:
+            record_hit(cache, entry, quiet=True)
+            emit(q, "cached", answer=entry["answer"], citations=entry["citations"], paid_usdc="0")
+
+    def work(qs: list[str]):
+        nonlocal challenge, round_trips_saved
+        signed_against = challenge if presign_payments else None
+        if signed_against is not None and not budget.reserve(payment_reservation(True)):
+            signed_against = None  # too little left to also cover a rejected pre-signed payment
+        reserved = payment_reservation(signed_against is not None)
+        if signed_against is None and not budget.reserve(reserved):
+            return "skipped", {"error": "batch budget exhausted"}
+        try:
+            data, paid, latency = ask(session, qs[0], allowance=reserved,
+                                      presign=presign if signed_against is not None else None,
+                                      challenge=signed_against)
+        except QueryError as e:
+            return "error", {"error": str(e)}
+        finally:
+            # Count anything signed, even if the request failed afterwards.
+            budget.settle(reserved, _payment.paid)
+        with cache_lock:
+            store_answer(cache, qs[0], data, paid, latency)
+            if _payment.challenge is not None:
+                if _payment.challenge is signed_against:
+                    round_trips_saved += 1
+                else:  # fresh challenge from a 402: pre-sign the remaining queries against it
+                    challenge = _payment.challenge
+                    remember_challenge(cache, challenge)
+        return "ok", {
+            "answer": data.get("answer", "(no answer returned)"),
+            "citations": data.get("citations") or [],
+            "paid_usdc": str(Decimal(paid) / 10**USDC_DECIMALS),
+            "latency": round(latency, 2),
+        }
+
+    try:
+        if to_ask:
+            session, presign = build_session()
+            with ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+                futures = {pool.submit(work, qs): qs for qs in to_ask.values()}
+                for fut in as_completed(futures):
+                    status, fields = fut.result()
+                    for q in futures[fut]:
+                        emit(q, status, **fields)
+    finally:
+        save_cache(cache)
+
+    spent = Decimal(budget.spent) / 10**USDC_DECIMALS
+    print(
+        f"Batch: {len(questions)} questions — {counts['ok']} answered, {counts['cached']} from cache, "
+        f"{counts['error']} failed, {counts['skipped']} skipped (budget). Spent {spent} of {budget_usdc} USDC."
+        + (f" Pre-signed payments saved {round_trips_saved} round trips." if presign_payments else ""),
+        file=sys.stderr,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Ask the GM Farcaster archive a question (paid via x402).")
+    parser.add_argument("query", nargs="*", help="your question about the GM Farcaster archive")
+    parser.add_argument("--no-cache", action="store_true", help="skip the local answer cache and pay for a fresh answer")
+    parser.add_argument("--batch", metavar="FILE", help="read one question per line from FILE (- for stdin), print JSONL")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_BATCH_CONCURRENCY,
+                        help=f"parallel requests in batch mode (default {DEFAULT_BATCH_CONCURRENCY})")
+    parser.add_argument("--budget", default=DEFAULT_BATCH_BUDGET,
+                        help=f"max total USDC a batch may spend (default {DEFAULT_BATCH_BUDGET})")
+    parser.add_argument("--presign", action="store_true", default=PRESIGN,
+                        help="sign the payment up front against the last validated 402 challenge (one round trip)")
+    parser.add_argument("--stream", action="store_true", help="print the answer as it is generated")
+    parser.add_argument("--timings", action="store_true", help="report time-to-first-token and total latency")
+    args = parser.parse_args()
+
+    if args.batch:
+        guard_custom_endpoint()
+        run_batch(args.batch, args.concurrency, args.budget, not args.no_cache, args.presign)
+        return
+
+    query = " ".join(args.query).strip()
+    if not query:
+        sys.exit('Usage: python query.py "<your question about the GM Farcaster archive>"')
+
+    guard_custom_endpoint()
+    cache = load_cache()
+    if not args.no_cache:
+        entry = cached_answer(cache, query)
+        if entry is not None:
+            record_hit(cache, entry)
+            print_answer(entry)
+            return
+
+    session, presign = build_session()
+    challenge = load_challenge(cache) if args.presign else None
+    first_token = []
+
+    def on_text(text: str) -> None:
+        if not first_token:
+            first_token.append(time.monotonic())
+        sys.stdout.write(text)
+        sys.stdout.flush()
+
+    started = time.monotonic()
+    try:
+        data, paid, latency = ask(session, query, presign=presign if args.presign else None, challenge=challenge,
+                                  on_text=on_text if args.stream else None)
+    except QueryError as e:
+        if first_token:
+            print()
+        sys.exit(str(e))
+    if args.stream:
+        print()
+        print_citations(data)
+    else:
+        print_answer(data)
+    if args.stream or args.timings:
+        # Buffered answers arrive all at once, so their first token is the whole response.
+        ttft = first_token[0] - started if first_token else latency
+        print(f"NOTE: time to first token {ttft:.2f}s, total {latency:.2f}s "
+              f"({'streamed' if args.stream else 'buffered'}).", file=sys.stderr)
+    store_answer(cache, query, data, paid, latency)
+    if _payment.challenge is not None and _payment.challenge is not challenge:
+        remember_challenge(cache, _payment.challenge)
+    save_cache(cache)
 
 
 if __name__ == "__main__":
@@ -17,16 +17,29 @@ script prints a full preview (text, amount, endpoint, payer) and pays nothing.
     python request.py --sponsor "Acme Frames" --read "Today's GM is brought to you by Acme..." --url https://acme.xyz
     # submit (pays $5):
     python request.py --sponsor "Acme Frames" --read "..." --url https://acme.xyz --confirm
+    # many at once from CSV/JSONL (sponsor,read,url,refund_to,notes), capped at $25 total:
+    python request.py --batch reads.csv --budget 25 [--confirm]
     # check status (free, no payment):
     python request.py --status sho_8f3c2a1b9d4e
+    # check many (free; one request_id per line), optionally until all are decided:
+    python request.py --status-file ids.txt --watch 3600
+    # local ledger of every paid submission (no network except --sync):
+    python request.py --sync
+    python request.py --pending
+    python request.py --spent 2026-10
 
 Networks: Base mainnet = eip155:8453 (real USDC) | Base Sepolia = eip155:84532 (test USDC).
 """
 import argparse
+import csv
+import io
 import json
 import os
 import re
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal, InvalidOperation
 
 import requests
@@ -38,6 +51,26 @@ NETWORK = os.environ.get("GMFARCASTER_NETWORK", "eip155:8453")  # Base mainnet
 MAX_SPONSOR_CHARS = 120
 MAX_READ_CHARS = 280
 
+# --- Bulk status polling ------------------------------------------------------
+# Statuses after which a request never changes again (aired follows approved).
+TERMINAL_STATUSES = ("approved", "aired", "declined", "refunded", "not_found")
+# Seconds before re-polling an ID, keyed by its current status. Editorial review
+# is done by hand, so pending_review starts slow. Each poll that shows no change
+# doubles the delay up to STATUS_MAX_DELAY; a status change resets it.
+STATUS_POLL_DELAYS = {"pending_review": 60}
+STATUS_DEFAULT_DELAY = 15
+STATUS_MAX_DELAY = 900
+DEFAULT_STATUS_CONCURRENCY = 8
+
+# --- Local ledger -------------------------------------------------------------
+# Append-only JSONL: one "submitted" record per paid shoutout, then a "status"
+# record whenever a check sees its status change. Folding the file gives the
+# current state of every shoutout, so --pending and --spent need no network.
+# It is a record of money spent, so it lives outside ~/.cache.
+LEDGER_FILE = os.environ.get(
+    "GMFARCASTER_SHOUTOUT_LEDGER", os.path.expanduser("~/.local/share/gmfarcaster/shoutouts.jsonl")
+)
+
 # --- Local payment pins -----------------------------------------------------
 # The 402 challenge advertises the price, but the script only pays a challenge
 # that matches ALL of these. USDC has 6 decimals, so $5 = 5_000_000 atomic units.
@@ -69,6 +102,13 @@ def _max_amount_atomic() -> int:
 
 MAX_AMOUNT_ATOMIC = _max_amount_atomic()
 
+DEFAULT_BATCH_BUDGET = os.environ.get("GMFARCASTER_SHOUTOUT_BUDGET", "25")
+BATCH_FIELDS = ("sponsor", "read", "url", "refund_to", "notes")
+
+
+class SubmitError(Exception):
+    """A submission failed; the message is ready to show the user."""
+
 
 def pinned_payment_policy(version, reqs):
     """x402 payment policy: drop every challenge entry that doesn't match the pins.
@@ -139,7 +179,7 @@ def guard_custom_endpoint() -> None:
     )
 
 
-def validate_submission(args: argparse.Namespace) -> None:
+def submission_problems(args: argparse.Namespace) -> list[str]:
     problems = []
     if not args.sponsor.strip():
         problems.append("--sponsor is empty")
@@ -153,6 +193,11 @@ def validate_submission(args: argparse.Namespace) -> None:
         problems.append(f"--url must be an https:// URL, got: {args.url}")
     if args.refund_to and not re.fullmatch(r"0x[0-9a-fA-F]{40}", args.refund_to):
         problems.append(f"--refund-to is not a valid 0x-hex EVM address: {args.refund_to}")
+    return problems
+
+
+def validate_submission(args: argparse.Namespace) -> None:
+    problems = submission_problems(args)
     if problems:
         sys.exit("Refusing to submit (nothing was paid):\n  - " + "\n  - ".join(problems))
 
@@ -175,26 +220,31 @@ def print_preview(args: argparse.Namespace, payer: str) -> None:
     print("Confirm it with the user, then re-run the same command with --confirm to pay and submit.")
 
 
-def submit(args: argparse.Namespace) -> None:
-    from eth_account import Account
-    from x402 import NoMatchingRequirementsError, x402ClientSync
+def build_session(account, *policies):
+    """One x402 client + HTTP session, reusable for any number of submissions.
+
+    Extra payment policies run after the pins. Returns (session, paid), where
+    paid["atomic"] is set to the amount of each payment as it is signed.
+    """
+    from x402 import x402ClientSync
     from x402.mechanisms.evm.exact.client import ExactEvmScheme
     from x402.mechanisms.evm.signers import EthAccountSigner
-    from x402.http.clients.requests import PaymentError as X402HttpPaymentError
     from x402.http.clients.requests import x402_requests
 
-    validate_submission(args)
-    guard_custom_endpoint()
-    account = Account.from_key(load_private_key())
-
-    if not args.confirm:
-        print_preview(args, account.address)
-        return
-
     client = x402ClientSync()
     client.register(NETWORK, ExactEvmScheme(EthAccountSigner(account)))
     client.register_policy(pinned_payment_policy)
-    session = x402_requests(client)  # auto-handles 402 -> validate pins -> pay -> retry
+    for policy in policies:
+        client.register_policy(policy)
+    paid = {}
+    client.on_after_payment_creation(lambda ctx: paid.update(atomic=int(ctx.selected_requirements.get_amount())))
+    return x402_requests(client), paid  # auto-handles 402 -> validate pins -> pay -> retry
+
+
+def post_submission(session, args: argparse.Namespace) -> dict:
+    """POST one shoutout through the paying session; raises SubmitError."""
+    from x402 import NoMatchingRequirementsError
+    from x402.http.clients.requests import PaymentError as X402HttpPaymentError
 
     body = {"sponsor_name": args.sponsor, "read_text": args.read}
     if args.url:
@@ -207,13 +257,34 @@ def submit(args: argparse.Namespace) -> None:
     try:
         resp = session.post(API_URL, json=body, timeout=60)
         resp.raise_for_status()
+        return resp.json()
     except NoMatchingRequirementsError:
-        sys.exit(_pin_refusal_message())
+        raise SubmitError(_pin_refusal_message()) from None
     except X402HttpPaymentError as e:
         if isinstance(e.__cause__, NoMatchingRequirementsError):
-            sys.exit(_pin_refusal_message())
-        sys.exit(f"Payment handling failed before completion: {e}")
-    data = resp.json()
+            raise SubmitError(_pin_refusal_message()) from None
+        raise SubmitError(f"Payment handling failed before completion: {e}") from None
+    except (requests.RequestException, ValueError) as e:
+        raise SubmitError(f"Submission failed: {e}") from None
+
+
+def submit(args: argparse.Namespace) -> None:
+    from eth_account import Account
+
+    validate_submission(args)
+    guard_custom_endpoint()
+    account = Account.from_key(load_private_key())
+
+    if not args.confirm:
+        print_preview(args, account.address)
+        return
+
+    session, paid = build_session(account)
+    try:
+        data = post_submission(session, args)
+    except SubmitError as e:
+        sys.exit(str(e))
+    record_submission(data, args, account.address, paid.get("atomic"))
 
     print("Shoutout submitted — PENDING EDITORIAL REVIEW.")
     print("This is NOT a confirmed read: GM Farcaster may decline and refund it.")
@@ -225,7 +296,120 @@ def submit(args: argparse.Namespace) -> None:
     else:
         print("  status_url: (unexpected value from API — omitted; use the command below)")
     print(f"  amount:     {data.get('amount')}")
-    print("\nKeep the request_id. Check status with: python request.py --status <request_id>")
+    print(f"\nRecorded in {LEDGER_FILE}. Check status with: python request.py --status <request_id>")
+
+
+def read_batch(path: str) -> list[argparse.Namespace]:
+    """Rows of sponsor/read/url/refund_to/notes from a CSV (with a header) or JSONL file.
+
+    JSONL is detected by a leading `{`; `-` reads stdin. Each row becomes a
+    namespace shaped like the single-submit arguments.
+    """
+    f = sys.stdin if path == "-" else open(path, newline="")
+    with f:
+        text = f.read()
+    if text.lstrip().startswith("{"):
+        rows = []
+        for n, line in enumerate(text.splitlines(), 1):
+            if line.strip() and not line.lstrip().startswith("#"):
+                try:
+                    rows.append(json.loads(line))
+                except ValueError as e:
+                    sys.exit(f"{path} line {n} is not valid JSON: {e}")
+    else:
+        rows = list(csv.DictReader(io.StringIO(text)))
+    return [
+        argparse.Namespace(**{k: str(row.get(k) or "").strip() or None for k in BATCH_FIELDS})
+        for row in rows
+    ]
+
+
+def validate_batch(rows: list[argparse.Namespace]) -> None:
+    """Check every row before anything is paid; any problem stops the whole batch."""
+    problems = []
+    for n, row in enumerate(rows, 1):
+        row.sponsor, row.read = row.sponsor or "", row.read or ""
+        problems += [f"row {n}: {p}" for p in submission_problems(row)]
+    if not rows:
+        problems.append("the batch file has no rows")
+    if problems:
+        sys.exit("Refusing to submit the batch (nothing was paid):\n  - " + "\n  - ".join(problems))
+
+
+def print_batch_preview(rows: list[argparse.Namespace], payer: str, budget_atomic: int) -> None:
+    affordable = min(len(rows), budget_atomic // MAX_AMOUNT_ATOMIC)
+    print(f"PREVIEW — {len(rows)} shoutouts; nothing has been paid or submitted yet.")
+    print(f"  endpoint:   {API_URL}")
+    print(f"  network:    {NETWORK}")
+    print(f"  price:      up to {MAX_PRICE_USDC} USDC each, paid to {' or '.join(EXPECTED_PAYEES)}")
+    print(f"  budget:     {_usdc(budget_atomic)} USDC total (covers at least {affordable} at the max price)")
+    print(f"  payer:      {payer}")
+    for n, row in enumerate(rows, 1):
+        print(f"\n  [{n}] sponsor:   {row.sponsor}")
+        print(f'      read text: "{row.read}"')
+        print(f"      url:       {row.url or '(none)'}")
+        if row.refund_to:
+            print(f"      refund-to: {row.refund_to}  <-- OVERRIDES the default refund destination")
+        if row.notes:
+            print(f"      notes:     {row.notes} (internal only, never read on air)")
+    print("\nEach read text above is what will be read LIVE ON AIR if approved.")
+    print("Confirm them with the user, then re-run the same command with --confirm to pay and submit.")
+
+
+def submit_batch(path: str, budget_usdc: str, confirm: bool) -> None:
+    """Validate every row, then preview or pay and submit them in order over one session.
+
+    The budget is a policy layered after the pins: a challenge that would take
+    total spend past it is refused before signing, and the batch stops there.
+    """
+    from eth_account import Account
+
+    try:
+        budget_atomic = int(Decimal(budget_usdc) * 10**USDC_DECIMALS)
+    except InvalidOperation:
+        sys.exit(f"--budget is not a valid decimal USDC amount: {budget_usdc!r}")
+    rows = read_batch(path)
+    validate_batch(rows)
+    guard_custom_endpoint()
+    account = Account.from_key(load_private_key())
+
+    if not confirm:
+        print_batch_preview(rows, account.address, budget_atomic)
+        return
+
+    budget = {"left": budget_atomic, "hit": False}
+
+    def budget_policy(version, reqs):
+        kept = [r for r in reqs if int(r.get_amount()) <= budget["left"]]
+        budget["hit"] = bool(reqs) and not kept
+        return kept
+
+    session, paid = build_session(account, budget_policy)
+    submitted = 0
+    for n, row in enumerate(rows, 1):
+        paid.clear()
+        try:
+            data = post_submission(session, row)
+        except SubmitError as e:
+            if budget["hit"]:
+                e = SubmitError(f"budget of {budget_usdc} USDC reached; no payment was signed for this row")
+            print(f"[{n}] FAILED: {e}", file=sys.stderr)
+            break
+        finally:
+            # Anything signed counts against the budget, even if the request then failed.
+            budget["left"] -= paid.get("atomic", 0)
+        record_submission(data, row, account.address, paid.get("atomic"))
+        submitted += 1
+        print(f"[{n}] {data.get('request_id')}  {data.get('status')}  {row.sponsor}")
+
+    spent = budget_atomic - budget["left"]
+    print(
+        f"\nSubmitted {submitted} of {len(rows)}{' — all PENDING EDITORIAL REVIEW' if submitted else ''}. "
+        f"Spent {_usdc(spent)} of {budget_usdc} USDC. Recorded in {LEDGER_FILE}.",
+    )
+    if submitted < len(rows):
+        done = f"; remove rows 1-{submitted} before re-running, or they will be paid for again" if submitted else ""
+        sys.exit(f"Rows {submitted + 1}-{len(rows)} were not submitted{done}.")
 
 
 def check_status(request_id: str) -> None:
@@ -233,7 +417,229 @@ def check_status(request_id: str) -> None:
     if resp.status_code == 404:
         sys.exit(f"No shoutout request found with id {request_id!r} — check the request_id.")
     resp.raise_for_status()
-    print(json.dumps(resp.json(), indent=2))
+    data = resp.json()
+    if data.get("status"):
+        record_statuses({request_id: str(data["status"])})
+    print(json.dumps(data, indent=2))
+
+
+def read_request_ids(path: str) -> list[str]:
+    """One request_id per line (blank lines and #-comments skipped); `-` reads stdin.
+
+    Lines that are JSON objects are read as {"request_id": ...}, so a previous
+    --status-file run's output can be fed back in. Duplicates are dropped.
+    """
+    f = sys.stdin if path == "-" else open(path)
+    with f:
+        ids = []
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            if line.startswith("{"):
+                line = str(json.loads(line).get("request_id", "")).strip()
+            if line and line not in ids:
+                ids.append(line)
+    return ids
+
+
+def fetch_status(session: requests.Session, request_id: str) -> str:
+    """Current status of one request; "not_found" for an unknown id."""
+    resp = session.get(f"{_status_base()}/v1/shoutout/{request_id}", timeout=30)
+    if resp.status_code == 404:
+        return "not_found"
+    resp.raise_for_status()
+    return str(resp.json().get("status") or "unknown")
+
+
+def poll_statuses(ids: list[str], concurrency: int, watch: float) -> dict:
+    """Poll every request_id over one pooled session, printing JSONL.
+
+    A line is printed the first time an ID's status is seen and again whenever
+    it changes. With watch=0 every ID is polled once; otherwise IDs keep being
+    polled, each on its own backoff (STATUS_POLL_DELAYS), until they reach a
+    terminal status or `watch` seconds pass. Returns {request_id: last status}.
+    """
+    status = {}
+    errors = {}
+    for request_id in ids:
+        # The id becomes part of the URL path; never let a line escape it.
+        if not re.fullmatch(r"[A-Za-z0-9_-]{1,64}", request_id):
+            errors[request_id] = "not a valid request_id"
+    active = [i for i in ids if i not in errors]
+    if not active and not errors:
+        print("No request_ids to check.", file=sys.stderr)
+        return status
+
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_maxsize=max(1, concurrency))
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+    started = time.time()
+    deadline = started + watch
+    due = dict.fromkeys(active, 0.0)
+    delay = {}
+    out_lock = threading.Lock()
+
+    def poll(request_id: str) -> None:
+        try:
+            new = fetch_status(session, request_id)
+        except (requests.RequestException, ValueError) as e:
+            # Transient: keep the last known status and back off as if unchanged.
+            print(f"WARNING: status check for {request_id} failed: {e}", file=sys.stderr)
+            errors[request_id] = str(e)
+            new = status.get(request_id)
+        else:
+            errors.pop(request_id, None)
+        if new is not None and new != status.get(request_id):
+            status[request_id] = new
+            delay[request_id] = STATUS_POLL_DELAYS.get(new, STATUS_DEFAULT_DELAY)
+            with out_lock:
+                print(json.dumps({"request_id": request_id, "status": new,
+                                  "elapsed": round(time.time() - started, 1)}), flush=True)
+        else:
+            delay[request_id] = min(delay.get(request_id, STATUS_DEFAULT_DELAY) * 2, STATUS_MAX_DELAY)
+        due[request_id] = time.time() + delay[request_id]
+
+    with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(active) or 1))) as pool:
+        while active:
+            now = time.time()
+            list(pool.map(poll, [i for i in active if due[i] <= now]))
+            active = [i for i in active if status.get(i) not in TERMINAL_STATUSES]
+            if not active or time.time() >= deadline:
+                break
+            time.sleep(max(0.0, min(min(due[i] for i in active), deadline) - time.time()))
+
+    for request_id in ids:
+        if request_id not in status:
+            print(json.dumps({"request_id": request_id, "status": "error", "error": errors.get(request_id)}))
+    counts = {}
+    for request_id in ids:
+        s = status.get(request_id, "error")
+        counts[s] = counts.get(s, 0) + 1
+    summary = ", ".join(f"{n} {s}" for s, n in sorted(counts.items()))
+    print(f"Status: {len(ids)} request(s) — {summary}.", file=sys.stderr)
+    if active and watch:
+        print(f"{len(active)} request(s) still undecided after {watch:g}s; run again later.", file=sys.stderr)
+    return status
+
+
+def _utc_now() -> str:
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+
+
+def append_ledger(records: list[dict]) -> None:
+    try:
+        os.makedirs(os.path.dirname(LEDGER_FILE) or ".", exist_ok=True)
+        with open(LEDGER_FILE, "ab+") as f:
+            # A crash mid-write can leave the last line unterminated; start on a
+            # fresh line so the new records aren't glued onto it and lost too.
+            f.seek(0, os.SEEK_END)
+            lead = b""
+            if f.tell():
+                f.seek(-1, os.SEEK_END)
+                lead = b"" if f.read(1) == b"\n" else b"\n"
+            f.write(lead + "".join(json.dumps(r) + "\n" for r in records).encode())
+    except OSError as e:
+        print(f"WARNING: could not write the shoutout ledger {LEDGER_FILE}: {e}", file=sys.stderr)
+
+
+def load_ledger() -> dict:
+    """Fold the ledger into {request_id: entry}, in submission order."""
+    entries = {}
+    try:
+        f = open(LEDGER_FILE)
+    except FileNotFoundError:
+        return entries
+    with f:
+        for number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+                if not isinstance(record, dict):
+                    raise ValueError("not a JSON object")
+            except ValueError:
+                # Most likely a line cut short by a crash mid-write.
+                print(f"WARNING: skipping unreadable line {number} of {LEDGER_FILE}: {line.strip()[:120]}",
+                      file=sys.stderr)
+                continue
+            request_id = record.get("request_id")
+            if record.get("type") == "submitted":
+                entries[request_id] = dict(record, status_at=record["submitted_at"])
+            elif record.get("type") == "status" and request_id in entries:
+                entries[request_id].update(status=record["status"], status_at=record["at"])
+    return entries
+
+
+def record_submission(data: dict, args: argparse.Namespace, payer: str, paid_atomic: int | None) -> None:
+    now = _utc_now()
+    append_ledger([{
+        "type": "submitted",
+        "request_id": data.get("request_id"),
+        "status": str(data.get("status") or "pending_review"),
+        "submitted_at": now,
+        "sponsor": args.sponsor,
+        "payer": payer,
+        "network": NETWORK,
+        "endpoint": API_URL,
+        # What was actually signed; the API's own amount string is kept as-is.
+        "paid_atomic": paid_atomic,
+        "amount": data.get("amount"),
+    }])
+
+
+def record_statuses(statuses: dict) -> None:
+    """Append a status record for each ledger entry whose status changed."""
+    ledger = load_ledger()
+    now = _utc_now()
+    append_ledger([
+        {"type": "status", "request_id": request_id, "status": status, "at": now}
+        for request_id, status in statuses.items()
+        if request_id in ledger and ledger[request_id]["status"] != status
+    ])
+
+
+def sync_ledger(concurrency: int, watch: float) -> None:
+    """Refresh the status of every ledger entry that is not yet terminal."""
+    pending = [i for i, e in load_ledger().items() if e["status"] not in TERMINAL_STATUSES]
+    if not pending:
+        print("Ledger is up to date: no undecided shoutouts.", file=sys.stderr)
+        return
+    record_statuses(poll_statuses(pending, concurrency, watch))
+
+
+def _usdc(atomic: int) -> str:
+    return str(Decimal(atomic) / 10**USDC_DECIMALS)
+
+
+def print_pending() -> None:
+    pending = [e for e in load_ledger().values() if e["status"] not in TERMINAL_STATUSES]
+    if not pending:
+        print("No undecided shoutouts in the ledger.")
+        return
+    for e in pending:
+        print(f"{e['request_id']}  {e['status']:<15} submitted {e['submitted_at']}  "
+              f"last seen {e['status_at']}  {e['sponsor']}")
+    print(f"\n{len(pending)} undecided (as of the last check; run --sync to refresh).")
+
+
+def print_spent(period: str) -> None:
+    """Paid, refunded and net USDC for submissions made in `period` (YYYY, YYYY-MM, or "all")."""
+    if period != "all" and not re.fullmatch(r"\d{4}(-\d{2}(-\d{2})?)?", period):
+        sys.exit(f"--spent takes YYYY, YYYY-MM, YYYY-MM-DD or 'all', got: {period!r}")
+    entries = [e for e in load_ledger().values() if period == "all" or e["submitted_at"].startswith(period)]
+    paid = sum(e["paid_atomic"] or 0 for e in entries)
+    # Declined requests are always refunded, and polling stops at "declined".
+    refunded = sum(e["paid_atomic"] or 0 for e in entries if e["status"] in ("declined", "refunded"))
+    unknown = sum(1 for e in entries if e["paid_atomic"] is None)
+    print(f"Shoutouts submitted ({period}): {len(entries)}")
+    print(f"  paid:      {_usdc(paid)} USDC")
+    print(f"  refunded:  {_usdc(refunded)} USDC (declined or refunded)")
+    print(f"  net spend: {_usdc(paid - refunded)} USDC")
+    if unknown:
+        print(f"  ({unknown} submission(s) have no recorded payment amount)")
 
 
 def main() -> None:
@@ -249,8 +655,56 @@ def main() -> None:
         help="Actually pay and submit. Without it, print a preview and pay nothing.",
     )
     p.add_argument("--status", dest="status_id", help="Check status of a request_id (free).")
+    p.add_argument(
+        "--status-file",
+        metavar="FILE",
+        help="Check every request_id in FILE, one per line (- for stdin); prints JSONL (free).",
+    )
+    p.add_argument(
+        "--watch",
+        type=float,
+        default=0,
+        metavar="SECONDS",
+        help="With --status-file or --sync, keep polling undecided requests for up to SECONDS.",
+    )
+    p.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_STATUS_CONCURRENCY,
+        help=f"Parallel status requests with --status-file or --sync (default {DEFAULT_STATUS_CONCURRENCY}).",
+    )
+    p.add_argument("--sync", action="store_true", help="Refresh undecided shoutouts in the local ledger (free).")
+    p.add_argument("--pending", action="store_true", help="List undecided shoutouts from the ledger (offline).")
+    p.add_argument(
+        "--spent",
+        nargs="?",
+        const=time.strftime("%Y-%m", time.gmtime()),
+        metavar="PERIOD",
+        help="USDC paid/refunded for YYYY, YYYY-MM (default: this month) or 'all', from the ledger (offline).",
+    )
+    p.add_argument("--batch", metavar="FILE", help="Submit every row of a CSV/JSONL file (- for stdin).")
+    p.add_argument(
+        "--budget",
+        default=DEFAULT_BATCH_BUDGET,
+        help=f"Max total USDC a --batch may spend (default {DEFAULT_BATCH_BUDGET}).",
+    )
     args = p.parse_args()
 
+    if args.batch:
+        submit_batch(args.batch, args.budget, args.confirm)
+        return
+    if args.status_file:
+        record_statuses(poll_statuses(read_request_ids(args.status_file), args.concurrency, args.watch))
+        return
+    if args.sync:
+        sync_ledger(args.concurrency, args.watch)
+        return
+    if args.pending:
+        print_pending()
+        return
+    if args.spent:
+        print_spent(args.spent)
+        return
     if args.status_id:
         check_status(args.status_id)
         return
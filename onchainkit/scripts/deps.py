@@ -0,0 +1,218 @@
+"""
+Dependency snapshot for OnchainKit projects.
+
+Answers "is X installed, and at which version?" for any number of packages
+from one read of package.json, the lockfile and node_modules, instead of one
+`npm ls` (a Node startup plus a full tree walk) per question. Used by
+validate-setup.py and setup-environment.py:
+
+    from deps import dependency_snapshot
+    snapshot = dependency_snapshot()
+    snapshot.installed("react")        # '18.3.1', or None
+    snapshot.problem("viem")           # None, or why it is not usable
+
+Supported lockfiles: package-lock.json / npm-shrinkwrap.json (v1-v3),
+pnpm-lock.yaml (v5-v9) and yarn.lock (classic and berry), parsed with the
+standard library only. Without a lockfile the layout of node_modules is not
+known, so the snapshot is built from a single `npm ls --json` call instead.
+"""
+
+import json
+import re
+import subprocess
+import threading
+from pathlib import Path
+
+DEPENDENCY_FIELDS = ("dependencies", "devDependencies", "optionalDependencies", "peerDependencies")
+LOCKFILES = ("package-lock.json", "npm-shrinkwrap.json", "pnpm-lock.yaml", "yarn.lock")
+
+# `key: value` / `key:` lines of the YAML subset pnpm writes; keys may be quoted.
+YAML_LINE = re.compile(r"""^(['"]?)(.+?)\1:(?:\s+(.*))?$""")
+
+
+def parse_npm_lock(text):
+    """Top-level {name: version} from package-lock.json / npm-shrinkwrap.json."""
+    data = json.loads(text)
+    locked = {}
+    for key, entry in data.get("packages", {}).items():  # lockfileVersion 2 and 3
+        name = key[len("node_modules/"):]
+        if key.startswith("node_modules/") and "/node_modules/" not in name and "version" in entry:
+            locked[name] = entry["version"]
+    if not locked:  # lockfileVersion 1
+        for name, entry in data.get("dependencies", {}).items():
+            if "version" in entry:
+                locked[name] = entry["version"]
+    return locked
+
+
+def parse_pnpm_lock(text):
+    """Root importer {name: version} from pnpm-lock.yaml.
+
+    Handles the v5 layout (`dependencies: {name: version}`), v6 (top-level
+    `dependencies: {name: {specifier, version}}`) and v6+/v9 workspaces
+    (`importers: {.: {dependencies: ...}}`). Peer suffixes such as
+    `18.3.1(react@18.3.1)` (v6+) or `1.4.0_react@18.2.0` (v5) are dropped.
+    """
+    locked = {}
+    stack = []  # (indent, key) of the enclosing mappings
+    for line in text.splitlines():
+        stripped = line.strip()
+        if not stripped or stripped.startswith("#") or stripped.startswith("- "):
+            continue
+        match = YAML_LINE.match(stripped)
+        if not match:
+            continue
+        indent = len(line) - len(line.lstrip())
+        while stack and stack[-1][0] >= indent:
+            stack.pop()
+        key, value = match.group(2), (match.group(3) or "").strip("'\"")
+        path = [k for _, k in stack]
+        if path[:2] == ["importers", "."]:
+            path = path[2:]
+        elif path and path[0] == "importers":
+            path = None
+        if path and path[0] in DEPENDENCY_FIELDS:
+            if len(path) == 1 and value:  # v5: name: version
+                locked[key] = value.split("_")[0]
+            elif len(path) == 2 and key == "version":  # v6+: name: {version: ...}
+                locked[path[1]] = value.split("(")[0]
+        stack.append((indent, key))
+    return locked
+
+
+def parse_yarn_lock(text, manifest):
+    """{name: version} from yarn.lock for the ranges package.json declares.
+
+    Entries are keyed by every `name@range` that resolved to them (berry adds
+    an `npm:` protocol). A name declared with a range the lockfile does not
+    list still resolves if the lockfile holds exactly one version of it.
+    """
+    by_spec, versions = {}, {}
+    specs = []
+    for line in text.splitlines():
+        if not line.strip() or line.startswith("#"):
+            continue
+        if not line[0].isspace() and line.rstrip().endswith(":"):
+            specs = [s.strip().strip("'\"") for s in line.rstrip()[:-1].split(",")]
+            continue
+        stripped = line.strip()
+        if specs and (stripped.startswith("version ") or stripped.startswith("version:")):
+            version = stripped[len("version"):].lstrip(": ").strip("'\"")
+            for spec in specs:
+                name, _, spec_range = spec.rpartition("@")
+                if not name:  # "@scope" without a range
+                    continue
+                by_spec[(name, spec_range.removeprefix("npm:"))] = version
+                versions.setdefault(name, set()).add(version)
+            specs = []
+    locked = {}
+    for name, declared in manifest.items():
+        version = by_spec.get((name, declared))
+        if version is None and len(versions.get(name, ())) == 1:
+            version = next(iter(versions[name]))
+        if version is not None:
+            locked[name] = version
+    return locked
+
+
+class DependencySnapshot:
+    """What a project declares, locks and has installed, read once."""
+
+    def __init__(self, root="."):
+        self.root = Path(root)
+        self.manifest = {}  # name -> declared range, from package.json
+        self.locked = {}    # name -> version pinned by the lockfile
+        self.lockfile = None
+        self.source = "node_modules"
+        self._installed = {}
+        self._lock = threading.Lock()
+
+        try:
+            with open(self.root / "package.json") as f:
+                package = json.load(f)
+        except (OSError, ValueError):
+            package = {}
+        for field in DEPENDENCY_FIELDS:
+            for name, declared in (package.get(field) or {}).items():
+                self.manifest.setdefault(name, declared)
+
+        for lockfile in LOCKFILES:
+            path = self.root / lockfile
+            if path.exists():
+                self.lockfile = lockfile
+                self.locked = self._parse_lockfile(lockfile, path.read_text())
+                break
+        else:
+            self._load_from_npm_ls()
+
+    def _parse_lockfile(self, lockfile, text):
+        try:
+            if lockfile == "pnpm-lock.yaml":
+                return parse_pnpm_lock(text)
+            if lockfile == "yarn.lock":
+                return parse_yarn_lock(text, self.manifest)
+            return parse_npm_lock(text)
+        except ValueError:
+            return {}  # unreadable lockfile: answer from node_modules alone
+
+    def _load_from_npm_ls(self):
+        """Fill the installed versions from one `npm ls --json` (no lockfile to read)."""
+        self.source = "npm ls"
+        try:
+            result = subprocess.run(["npm", "ls", "--json", "--depth=0"], cwd=self.root,
+                                    capture_output=True, text=True)
+            tree = json.loads(result.stdout or "{}")
+        except (OSError, ValueError):
+            tree = {}
+        for name, entry in (tree.get("dependencies") or {}).items():
+            usable = "version" in entry and not entry.get("missing") and not entry.get("invalid")
+            self._installed[name] = entry["version"] if usable else None
+
+    def installed(self, name):
+        """Version of `name` in node_modules, or None when it is not installed."""
+        with self._lock:
+            if name not in self._installed:
+                if self.source == "npm ls":
+                    self._installed[name] = None  # npm ls listed everything installed
+                else:
+                    try:
+                        with open(self.root / "node_modules" / name / "package.json") as f:
+                            self._installed[name] = json.load(f).get("version")
+                    except (OSError, ValueError):
+                        self._installed[name] = None
+            return self._installed[name]
+
+    def problem(self, name):
+        """Why `name` is not usable, or None if it is installed and matches the lockfile."""
+        version = self.installed(name)
+        if version is None:
+            return f"{name} is not installed"
+        locked = self.locked.get(name)
+        if locked is not None and locked != version:
+            return f"{name} {version} is installed but {self.lockfile} pins {locked} (run npm install)"
+        return None
+
+    def is_installed(self, name):
+        return self.problem(name) is None
+
+    def missing(self, names):
+        """{name: problem} for every name that is not usable."""
+        problems = {name: self.problem(name) for name in names}
+        return {name: p for name, p in problems.items() if p is not None}
+
+
+_snapshot = None
+_snapshot_lock = threading.Lock()
+
+
+def dependency_snapshot(refresh=False):
+    """The shared snapshot of the current directory, built on first use.
+
+    Safe to call from several threads; pass refresh=True after installing
+    packages.
+    """
+    global _snapshot
+    with _snapshot_lock:
+        if _snapshot is None or refresh:
+            _snapshot = DependencySnapshot()
+        return _snapshot
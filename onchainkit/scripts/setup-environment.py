@@ -10,6 +10,8 @@ import sys
 from pathlib import Path
 import json
 
+from deps import dependency_snapshot
+
 def check_current_directory():
     """Check if we're in a valid OnchainKit project."""
     package_json = Path("package.json")
@@ -107,10 +109,8 @@ def install_onchainkit():
     """Install OnchainKit if not already installed."""
     try:
         import subprocess
-        result = subprocess.run(["npm", "ls", "@coinbase/onchainkit"], 
-                              capture_output=True, text=True)
         
-        if result.returncode != 0:
+        if not dependency_snapshot().is_installed("@coinbase/onchainkit"):
             print("📦 Installing @coinbase/onchainkit...")
             install_result = subprocess.run(["npm", "install", "@coinbase/onchainkit"], 
                                           capture_output=True, text=True)
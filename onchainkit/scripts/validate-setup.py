@@ -3,29 +3,92 @@
 OnchainKit Setup Validator
 
 Validates that an OnchainKit project is properly configured and ready for development.
+The checks are independent and read-only, so they run concurrently; their
+output is still printed in order. Dependency checks share one snapshot of
+package.json, the lockfile and node_modules (see deps.py) instead of running
+`npm ls` per package.
 """
 
+import io
 import os
 import sys
 import json
+import time
+import threading
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from urllib.parse import urlparse
 
-def check_with_status(check_name, check_function):
-    """Run a check function and print status."""
-    print(f"🔍 {check_name}...", end=" ")
+from deps import dependency_snapshot
+
+class ThreadOutput:
+    """sys.stdout stand-in that sends each worker thread's prints to its own buffer."""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.local = threading.local()
+
+    def write(self, text):
+        buffer = getattr(self.local, "buffer", None)
+        return (buffer or self.stream).write(text)
+
+    def flush(self):
+        self.stream.flush()
+
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
+def run_check(check_function):
+    """Run a check function, returning (passed, error, seconds)."""
+    start = time.perf_counter()
     try:
-        result = check_function()
-        if result:
-            print("✅")
-            return True
-        else:
-            print("❌")
-            return False
+        return bool(check_function()), None, time.perf_counter() - start
     except Exception as e:
-        print(f"❌ Error: {e}")
-        return False
+        return False, e, time.perf_counter() - start
+
+def print_status(passed, error, elapsed):
+    if error is not None:
+        print(f"❌ Error: {error} ({elapsed:.2f}s)")
+    else:
+        print(f"{'✅' if passed else '❌'} ({elapsed:.2f}s)")
+
+def check_with_status(check_name, check_function):
+    """Run a check function and print status. Returns (passed, seconds)."""
+    print(f"🔍 {check_name}...", end=" ", flush=True)
+    passed, error, elapsed = run_check(check_function)
+    print_status(passed, error, elapsed)
+    return passed, elapsed
+
+def run_checks(checks):
+    """Run checks on a thread pool, printing each one's output in list order.
+
+    Whatever a check prints is captured per thread and written out under its
+    own header once it finishes. Returns ({name: passed}, {name: seconds}).
+    """
+    output = ThreadOutput(sys.stdout)
+
+    def capture(check_function):
+        output.local.buffer = io.StringIO()
+        try:
+            return run_check(check_function) + (output.local.buffer.getvalue(),)
+        finally:
+            output.local.buffer = None
+
+    results, timings = {}, {}
+    sys.stdout = output
+    try:
+        with ThreadPoolExecutor(max_workers=len(checks)) as pool:
+            futures = [(name, pool.submit(capture, func)) for name, func in checks]
+            for check_name, future in futures:
+                passed, error, elapsed, captured = future.result()
+                print(f"🔍 {check_name}...", end=" ")
+                output.stream.write(captured)
+                print_status(passed, error, elapsed)
+                results[check_name], timings[check_name] = passed, elapsed
+    finally:
+        sys.stdout = output.stream
+    return results, timings
 
 def check_project_structure():
     """Check if we're in a valid Node.js project."""
@@ -44,27 +107,19 @@ def check_project_structure():
 
 def check_onchainkit_installed():
     """Check if OnchainKit is installed."""
-    try:
-        result = subprocess.run(["npm", "ls", "@coinbase/onchainkit"], 
-                              capture_output=True, text=True)
-        return result.returncode == 0
-    except:
-        return False
+    problem = dependency_snapshot().problem("@coinbase/onchainkit")
+    if problem:
+        print(problem)
+    return problem is None
 
 def check_required_dependencies():
     """Check if required peer dependencies are installed."""
     required_deps = ["react", "react-dom", "viem", "wagmi"]
     
-    try:
-        for dep in required_deps:
-            result = subprocess.run(["npm", "ls", dep], 
-                                  capture_output=True, text=True)
-            if result.returncode != 0:
-                print(f"Missing required dependency: {dep}")
-                return False
-        return True
-    except:
-        return False
+    missing = dependency_snapshot().missing(required_deps)
+    for dep, problem in missing.items():
+        print(f"Required dependency {problem}")
+    return not missing
 
 def check_env_file():
     """Check if .env.local exists and has required variables."""
@@ -189,12 +244,15 @@ def run_build_test():
         print(f"Build test error: {e}")
         return False
 
-def print_summary(results):
+def print_summary(results, timings, wall_time):
     """Print a summary of validation results."""
     passed = sum(results.values())
     total = len(results)
     
     print(f"\n📊 Validation Summary: {passed}/{total} checks passed")
+    slowest = max(timings, key=timings.get)
+    print(f"⏱️  {wall_time:.2f}s total ({sum(timings.values()):.2f}s of checks; "
+          f"slowest: {slowest} {timings[slowest]:.2f}s)")
     
     if passed == total:
         print("""
@@ -239,18 +297,17 @@ def main():
     ]
     
     # Run all checks
-    results = {}
-    for check_name, check_func in checks:
-        results[check_name] = check_with_status(check_name, check_func)
+    start = time.perf_counter()
+    results, timings = run_checks(checks)
     
-    # Optional build test (more intensive)
+    # Optional build test (more intensive), run alone after the others
     if "--skip-build" not in sys.argv:
-        results["Build test"] = check_with_status("Build test", run_build_test)
+        results["Build test"], timings["Build test"] = check_with_status("Build test", run_build_test)
     else:
         print("🔍 Build test... ⏭️  (skipped)")
     
     # Print summary
-    print_summary(results)
+    print_summary(results, timings, time.perf_counter() - start)
     
     # Exit with error code if any checks failed
     if not all(results.values()):
@@ -2,32 +2,50 @@
 """Symbiosis cross-chain quote (no execution).
 
 Usage: ./symbiosis-quote.sh <src_chain> <src_token> <src_decimals> <amount> <dst_chain> <dst_token> <dst_decimals>
+       ./symbiosis-quote.sh <src_chain> <src_token> <src_decimals> <amount> <dst_chain> <dst_token> <dst_decimals> --sweep [--slippages 50,100,200] [--max-splits 8]
+       ./symbiosis-quote.sh <src_chain> <src_token> <src_decimals> <amount> --to <chain:token:decimals> [--to ...] [--to-file <file>] [--concurrency N]
+
+Quotes are cached for a few seconds (SYMBIOSIS_QUOTE_TTL, default 15) keyed by
+route, slippage and a 0.5% amount bucket; pass --no-cache to force a live quote.
 
 Example: ./symbiosis-quote.sh 8453 0x833589fCD6eDb6E08f4c7C32D4f71b54bdA02913 6 100 137 0x3c499c542cEF5E3811e1192ce70d8cC03d5c3359 6
+         ./symbiosis-quote.sh 8453 0x833589fCD6eDb6E08f4c7C32D4f71b54bdA02913 6 100 \
+             --to 137:0x3c499c542cEF5E3811e1192ce70d8cC03d5c3359:6 --to 42161:0xaf88d065e77c8cC2239327C5EDb3A432268e5831:6
+         (quotes every destination in parallel and ranks them by net USD; outputs the
+          API gives no price for are only ranked against the same token)
+
+--sweep quotes amount/k for k = 1..max-splits at each slippage in parallel
+(the last chunk also carries the remainder), fits a linear price-impact curve
+and recommends how many swaps to split the transfer into to maximize total
+output tokens after per-swap fees. Fees are converted at the output's priceUsd;
+when the API gives none, only gross output and USD fees are shown.
 """
 
 import json
+import math
+import os
 import sys
+import threading
+import time
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal, InvalidOperation
+
+from units import format_units, to_decimal, to_smallest_units, usd_value
 
 SYMBIOSIS_API = "https://api-v2.symbiosis.finance/crosschain/v1/swap"
 PARTNER_ID = "bankr"
 FAKE_ADDR = "0x1111111111111111111111111111111111111111"
+ZERO_ADDR = "0x0000000000000000000000000000000000000000"
+DEFAULT_SLIPPAGE = 200
+DEFAULT_CONCURRENCY = 8
+DEFAULT_SWEEP_SLIPPAGES = (50, 100, 200)
+DEFAULT_MAX_SPLITS = 8
 
-
-def to_smallest_units(amount: str, decimals: int) -> str:
-    parts = amount.split(".")
-    integer = parts[0]
-    frac = parts[1] if len(parts) > 1 else ""
-    frac = (frac + "0" * decimals)[:decimals]
-    return str(int(integer + frac))
-
-
-def format_units(amount_raw: str, decimals: int) -> str:
-    s = amount_raw.zfill(decimals + 1)
-    int_part = s[: len(s) - decimals] or "0"
-    frac_part = s[len(s) - decimals :].rstrip("0")
-    return f"{int_part}.{frac_part}" if frac_part else int_part
+CACHE_DIR = os.environ.get("SYMBIOSIS_CACHE_DIR", os.path.expanduser("~/.cache/symbiosis"))
+QUOTE_CACHE_TTL = float(os.environ.get("SYMBIOSIS_QUOTE_TTL", "15"))
+QUOTE_CACHE_MAX = 256
+AMOUNT_BUCKET_BPS = 50  # amounts within ~0.5% of each other share a cache entry
 
 
 def api_post(url: str, payload: dict) -> dict:
@@ -43,25 +61,103 @@ def api_post(url: str, payload: dict) -> dict:
         return json.loads(resp.read())
 
 
-def main():
-    if len(sys.argv) < 8:
-        print(__doc__.strip())
-        sys.exit(1)
+class QuoteCache:
+    """Small on-disk LRU of recent quote responses.
+
+    Entries expire after QUOTE_CACHE_TTL seconds. The file is read once per
+    process and rewritten atomically after each store; dict order doubles as
+    the LRU order.
+    """
+
+    def __init__(self, path: str, ttl: float, max_entries: int):
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.lock = threading.Lock()
+        self.entries = None
+
+    def _load(self) -> dict:
+        if self.entries is None:
+            try:
+                with open(self.path) as f:
+                    self.entries = json.load(f)
+            except (OSError, ValueError):
+                self.entries = {}
+        return self.entries
+
+    def get(self, key: str):
+        with self.lock:
+            entries = self._load()
+            entry = entries.pop(key, None)
+            if entry is None or time.time() - entry["ts"] > self.ttl:
+                return None
+            entries[key] = entry
+            return entry
+
+    def put(self, key: str, amount_raw: str, result: dict) -> None:
+        with self.lock:
+            entries = self._load()
+            now = time.time()
+            for k in [k for k, e in entries.items() if now - e["ts"] > self.ttl]:
+                del entries[k]
+            entries.pop(key, None)
+            entries[key] = {"ts": now, "amount": amount_raw, "result": result}
+            while len(entries) > self.max_entries:
+                del entries[next(iter(entries))]
+            try:
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+                tmp = f"{self.path}.{os.getpid()}.{threading.get_ident()}.tmp"
+                with open(tmp, "w") as f:
+                    json.dump(entries, f)
+                os.replace(tmp, self.path)
+            except OSError:
+                pass  # caching is best-effort
+
+
+QUOTE_CACHE = QuoteCache(os.path.join(CACHE_DIR, "quotes.json"), QUOTE_CACHE_TTL, QUOTE_CACHE_MAX)
 
-    src_chain = int(sys.argv[1])
-    src_token = sys.argv[2]
-    src_dec = int(sys.argv[3])
-    amount = sys.argv[4]
-    dst_chain = int(sys.argv[5])
-    dst_token = sys.argv[6]
-    dst_dec = int(sys.argv[7])
+
+def amount_bucket(amount_raw: str) -> int:
+    """Log-scale bucket so nearby amounts map to the same cache key."""
+    return int(math.log(max(int(amount_raw), 1)) / math.log1p(AMOUNT_BUCKET_BPS / 10000))
+
+
+def quote_cache_key(src_chain, src_token, dst_chain, dst_token, slippage, amount_raw) -> str:
+    return ":".join(map(str, (src_chain, src_token.lower(), dst_chain, dst_token.lower(),
+                              slippage, amount_bucket(amount_raw))))
+
+
+def rescale_quote(result: dict, cached_amount: str, amount_raw: str) -> dict:
+    """Scale a cached quote's output linearly to a nearby input amount."""
+    if cached_amount == amount_raw:
+        return result
+    out = dict(result.get("tokenAmountOut", {}))
+    out["amount"] = str(int(out.get("amount", "0")) * int(amount_raw) // max(int(cached_amount), 1))
+    return {**result, "tokenAmountOut": out}
+
+
+def quote(src_chain: int, src_token: str, src_dec: int, amount_raw: str,
+          dst_chain: int, dst_token: str, dst_dec: int, slippage: int = DEFAULT_SLIPPAGE,
+          use_cache: bool = True) -> tuple[dict, str]:
+    """Request a Symbiosis quote, returning (result, source).
+
+    `source` is "live" or "cache (Ns old)". Cached outputs are rescaled to the
+    requested amount. With use_cache=False the cache is neither read nor
+    written. Raises ValueError when the API returns no route.
+    """
+    key = quote_cache_key(src_chain, src_token, dst_chain, dst_token, slippage, amount_raw)
+    if use_cache:
+        entry = QUOTE_CACHE.get(key)
+        if entry is not None:
+            age = int(time.time() - entry["ts"])
+            return rescale_quote(entry["result"], entry["amount"], amount_raw), f"cache ({age}s old)"
 
     result = api_post(SYMBIOSIS_API, {
         "tokenAmountIn": {
             "chainId": src_chain,
             "address": src_token,
             "decimals": src_dec,
-            "amount": to_smallest_units(amount, src_dec),
+            "amount": amount_raw,
         },
         "tokenOut": {
             "chainId": dst_chain,
@@ -70,27 +166,351 @@ def main():
         },
         "from": FAKE_ADDR,
         "to": FAKE_ADDR,
-        "slippage": 200,
+        "slippage": slippage,
         "partnerId": PARTNER_ID,
     })
-
     if "tx" not in result:
-        msg = result.get("message", result.get("error", json.dumps(result)))
-        print(f"ERROR: {msg}", file=sys.stderr)
-        sys.exit(1)
+        raise ValueError(result.get("message", result.get("error", json.dumps(result))))
+    if use_cache:
+        QUOTE_CACHE.put(key, amount_raw, result)
+    return result, "live"
 
-    out = result.get("tokenAmountOut", {})
-    out_human = format_units(out.get("amount", "0"), out.get("decimals", dst_dec))
 
+def summarize(result: dict, dst_dec: int) -> dict:
+    """Human-readable output, fee and net value of a quote.
+
+    `net_usd` prices the output at tokenAmountOut.priceUsd and subtracts the
+    fee in USD. The documented response carries no output price, and any
+    default would value every token at the same dollar amount, so `out_usd`
+    and `net_usd` are None when it is missing (or zero, or not a number);
+    `out_raw` (smallest units of the output token) is always there. USD
+    values are exact Decimals, and `out_price` is a positive Decimal or None.
+    """
+    out = result.get("tokenAmountOut", {})
+    out_dec = out.get("decimals", dst_dec)
+    out_raw = int(out.get("amount", "0"))
     fee = result.get("fee", {})
-    fee_human = float(format_units(fee.get("amount", "0"), fee.get("decimals", 6)))
-    fee_usd = fee_human * fee.get("priceUsd", 1)
+    fee_usd = usd_value(fee.get("amount", "0"), fee.get("decimals", 6), fee.get("priceUsd", 1))
+    price = out.get("priceUsd")
+    try:
+        price = Decimal(str(price)) if price is not None else None
+        if price is not None and not price > 0:
+            price = None  # a zero price would value the output at nothing
+    except InvalidOperation:  # not a number, or NaN
+        price = None
+    out_usd = usd_value(out_raw, out_dec, price) if price is not None else None
+    return {
+        "out": format_units(out_raw, out_dec),
+        "out_raw": out_raw,
+        "out_dec": out_dec,
+        "out_price": price,
+        "out_usd": out_usd,
+        "fee_usd": fee_usd,
+        "net_usd": out_usd - fee_usd if out_usd is not None else None,
+        "est": result.get("estimatedTime", "?"),
+    }
+
+
+def parse_destination(spec: str) -> tuple[int, str, int]:
+    """Parse a `chain:token:decimals` destination spec."""
+    try:
+        chain, token, decimals = spec.split(":")
+        return int(chain), token, int(decimals)
+    except ValueError:
+        print(f"ERROR: bad destination {spec!r}, expected <chain:token:decimals>", file=sys.stderr)
+        sys.exit(1)
+
+
+def parse_fanout_args(argv: list[str]) -> tuple[list[tuple[int, str, int]], int]:
+    """Collect --to / --to-file destinations and --concurrency from argv."""
+    dests = []
+    concurrency = DEFAULT_CONCURRENCY
+    i = 0
+    while i < len(argv):
+        flag = argv[i]
+        if flag not in ("--to", "--to-file", "--concurrency") or i + 1 >= len(argv):
+            print(f"ERROR: unexpected argument {flag!r}", file=sys.stderr)
+            sys.exit(1)
+        value = argv[i + 1]
+        if flag == "--to":
+            dests.append(parse_destination(value))
+        elif flag == "--to-file":
+            with open(value) as f:
+                dests += [parse_destination(line.strip()) for line in f
+                          if line.strip() and not line.startswith("#")]
+        else:
+            concurrency = int(value)
+        i += 2
+    return dests, concurrency
+
+
+def fanout(src_chain: int, src_token: str, src_dec: int, amount: str,
+           dests: list[tuple[int, str, int]], concurrency: int, use_cache: bool = True) -> None:
+    """Quote every destination concurrently and print them ranked by net value.
+
+    Only quotes with an output price can be ranked in USD. The rest are
+    listed separately and ranked by raw output only against destinations
+    receiving the same token.
+    """
+    amount_raw = to_smallest_units(amount, src_dec)
+
+    def one(dest):
+        dst_chain, dst_token, dst_dec = dest
+        started = time.monotonic()
+        try:
+            result, source = quote(src_chain, src_token, src_dec, amount_raw,
+                                   dst_chain, dst_token, dst_dec, use_cache=use_cache)
+            row = summarize(result, dst_dec)
+            row["source"] = source.split()[0]
+        except Exception as e:
+            row = {"error": str(e)}
+        row.update(chain=dst_chain, token=dst_token, latency_ms=int((time.monotonic() - started) * 1000))
+        return row
+
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+        rows = list(pool.map(one, dests))
 
-    est = result.get("estimatedTime", "?")
+    def eta(r):
+        return r["est"] if isinstance(r["est"], (int, float)) else float("inf")
+
+    def line(rank, r, net):
+        return (f"{rank:>2}  {r['chain']:>7}  {r['token']:<42}  {r['out']:>18}  {r['fee_usd']:>8.4f}  "
+                f"{net:>10}  {r['est']!s:>5}  {r['latency_ms']:>5}  {r['source']}")
+
+    ok = [r for r in rows if "error" not in r]
+    priced = sorted((r for r in ok if r["net_usd"] is not None), key=lambda r: (-r["net_usd"], eta(r)))
+    # Without a price only amounts of the same token compare. The zero address
+    # is each chain's own native coin, so it only matches on the same chain.
+    groups = {}
+    for r in ok:
+        if r["net_usd"] is None:
+            native = r["token"].lower() == ZERO_ADDR
+            key = (r["token"].lower(), r["out_dec"], r["chain"] if native else None)
+            groups.setdefault(key, []).append(r)
+    failed = [r for r in rows if "error" in r]
+
+    print(f"{amount} from chain {src_chain} -> {len(dests)} destinations")
+    print(f"{'#':>2}  {'Chain':>7}  {'Token':<42}  {'Output':>18}  {'Fee $':>8}  {'Net $':>10}  {'ETA s':>5}  {'ms':>5}  Source")
+    for rank, r in enumerate(priced, 1):
+        print(line(rank, r, f"{r['net_usd']:.4f}"))
+    if groups:
+        print("Unpriced (the API gave no output priceUsd): not ranked against the rows above; "
+              "ranked by output only within the same token")
+        for group in groups.values():
+            group.sort(key=lambda r: (-r["out_raw"], eta(r)))
+            for rank, r in enumerate(group, 1):
+                print(line(rank if len(group) > 1 else "-", r, "-"))
+    for r in failed:
+        print(f" -  {r['chain']:>7}  {r['token']:<42}  ERROR: {r['error']}  ({r['latency_ms']} ms)")
+    if not ok:
+        sys.exit(1)
+
+
+def fit_impact(points: list[tuple[float, float]]) -> tuple[float, float]:
+    """Least-squares fit of rate = c0 - c1 * size over (size, rate) points.
+
+    rate is output tokens per input unit; c1 > 0 means bigger swaps get worse
+    prices. Returns (c0, c1); c1 is 0 when there are too few distinct sizes.
+    """
+    n = len(points)
+    mean_x = sum(x for x, _ in points) / n
+    mean_y = sum(y for _, y in points) / n
+    var_x = sum((x - mean_x) ** 2 for x, _ in points)
+    if var_x == 0:
+        return mean_y, 0.0
+    slope = sum((x - mean_x) * (y - mean_y) for x, y in points) / var_x
+    return mean_y - slope * mean_x, -slope
+
+
+def fee_in_output(q: dict):
+    """A quote's USD fee in output tokens, or None without an output price."""
+    if q["out_price"] is None:
+        return None
+    return q["fee_usd"] / q["out_price"]
+
+
+def sweep(src_chain: int, src_token: str, src_dec: int, amount: str,
+          dst_chain: int, dst_token: str, dst_dec: int,
+          slippages: list[int], max_splits: int, concurrency: int) -> None:
+    """Quote an amount-split x slippage grid and recommend a split plan.
+
+    A plan of k swaps sends k - 1 chunks of amount // k and one last chunk
+    that also carries the remainder, so the whole amount is swapped. Both
+    chunk sizes are quoted at every slippage; the grid is deduplicated
+    through a memo of in-flight futures keyed by (chunk, slippage), so equal
+    chunks are only quoted once. The shared quote cache is bypassed because
+    its bucketing would blur the price impact we measure.
+
+    Plans are compared in output tokens. The USD fees are converted at the
+    output's priceUsd; without one they cannot be netted, so only the gross
+    output and the fees are shown and no plan is recommended.
+    """
+    total_raw = int(to_smallest_units(amount, src_dec))
+    total = float(to_decimal(total_raw, src_dec))  # the impact fit is plain float math
+    memo = {}
+    calls = 0
+
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+        def quoted(chunk_raw: int, slippage: int):
+            nonlocal calls
+            key = (chunk_raw, slippage)
+            if key not in memo:
+                calls += 1
+                memo[key] = pool.submit(quote, src_chain, src_token, src_dec, str(chunk_raw),
+                                        dst_chain, dst_token, dst_dec, slippage, False)
+            return memo[key]
+
+        grid = {(k, slip): (quoted(total_raw // k, slip), quoted(total_raw // k + total_raw % k, slip))
+                for k in range(1, max_splits + 1) if total_raw // k > 0
+                for slip in slippages}
+        rows = []
+        for (k, slip), (base_fut, last_fut) in grid.items():
+            try:
+                base = summarize(base_fut.result()[0], dst_dec)
+                last = summarize(last_fut.result()[0], dst_dec)
+            except Exception as e:
+                rows.append({"k": k, "slippage": slip, "error": str(e)})
+                continue
+            out_raw = (k - 1) * base["out_raw"] + last["out_raw"]
+            fees_out = [fee_in_output(base), fee_in_output(last)]
+            out = to_decimal(out_raw, base["out_dec"])
+            rows.append({"k": k, "slippage": slip, "base": base, "out_raw": out_raw, "out": out,
+                         "fee_usd": (k - 1) * base["fee_usd"] + last["fee_usd"],
+                         "net": (out - (k - 1) * fees_out[0] - fees_out[1]) if None not in fees_out else None})
+
+    ok = [r for r in rows if "error" not in r]
+    priced = bool(ok) and all(r["net"] is not None for r in ok)
+
+    def chunk_label(k: int) -> str:
+        chunk = format_units(total_raw // k, src_dec)
+        if total_raw % k and k > 1:
+            chunk += f" (+{format_units(total_raw % k, src_dec)} last)"
+        return chunk
+
+    print(f"Sweep: {amount} chain {src_chain} -> {dst_chain}, "
+          f"{len(grid)} grid points, {calls} quote calls")
+    print(f"{'Splits':>6}  {'Chunk':>28}  {'Slip bps':>8}  {'Total out':>20}  {'Fees $':>9}  {'Net out':>20}")
+    for r in sorted(rows, key=lambda r: (r["k"], r["slippage"])):
+        if "error" in r:
+            print(f"{r['k']:>6}  {chunk_label(r['k']):>28}  {r['slippage']:>8}  ERROR: {r['error']}")
+        else:
+            net = f"{r['net']:.6f}" if r["net"] is not None else "-"
+            print(f"{r['k']:>6}  {chunk_label(r['k']):>28}  {r['slippage']:>8}  "
+                  f"{format_units(r['out_raw'], r['base']['out_dec']):>20}  "
+                  f"{r['fee_usd']:>9.4f}  {net:>20}")
+    if not ok:
+        sys.exit(1)
+
+    # Slippage only sets the minimum output, so for the fit keep one quote per size.
+    by_k = {}
+    for r in ok:
+        by_k.setdefault(r["k"], r["base"])
+    c0, c1 = fit_impact([(float(to_decimal(total_raw // k, src_dec)),
+                          float(to_decimal(q["out_raw"], q["out_dec"])) / float(to_decimal(total_raw // k, src_dec)))
+                         for k, q in by_k.items()])
+    print(f"\nImpact fit: rate = {c0:.6f} - {c1:.3e} * size output/input  "
+          f"(~{100 * c1 * total / c0 if c0 else 0:.3f}% at full size)")
+
+    def single_swap(field: str):
+        return max((r for r in ok if r["k"] == 1), key=lambda r: r[field], default=None)
+
+    # On ties prefer fewer swaps, then the tightest slippage.
+    if not priced:
+        print("No output priceUsd from the API: the USD fees cannot be netted against the output, "
+              "so no plan is recommended.")
+        best = max(ok, key=lambda r: (r["out_raw"], -r["k"], -r["slippage"]))
+        single = single_swap("out_raw")
+        out_dec = best["base"]["out_dec"]
+        print(f"Most gross output: {best['k']} swap(s) of {chunk_label(best['k'])} at {best['slippage']} bps "
+              f"-> {format_units(best['out_raw'], out_dec)} out, ${best['fee_usd']:.4f} fees")
+        if single is not None and best["k"] > 1:
+            gain = format_units(best["out_raw"] - single["out_raw"], out_dec)
+            extra_fees = best["fee_usd"] - single["fee_usd"]
+            print(f"  vs one swap: {'' if gain.startswith('-') else '+'}{gain} out for "
+                  f"${extra_fees:.4f} more in fees")
+        return
+
+    fee = float(sum(fee_in_output(q) for q in by_k.values())) / len(by_k)
+    print(f"Avg fee per swap: {fee:.6f} output tokens")
+    if c1 > 0 and fee > 0:
+        print(f"Fitted optimum: ~{total * math.sqrt(c1 / fee):.1f} splits")
+    best = max(ok, key=lambda r: (r["net"], -r["k"], -r["slippage"]))
+    single = single_swap("net")
+    print(f"Recommendation: {best['k']} swap(s) of {chunk_label(best['k'])} at {best['slippage']} bps slippage "
+          f"-> ~{best['net']:.6f} net output")
+    if single is not None and best["k"] > 1:
+        print(f"  vs one swap: ~{single['net']:.6f} net output ({best['net'] - single['net']:+.6f})")
+
+
+def parse_sweep_args(argv: list[str]) -> tuple[list[int], int, int]:
+    slippages, max_splits, concurrency = list(DEFAULT_SWEEP_SLIPPAGES), DEFAULT_MAX_SPLITS, DEFAULT_CONCURRENCY
+    args = [a for a in argv if a != "--sweep"]
+    for flag, value in zip(args[::2], args[1::2]):
+        if flag == "--slippages":
+            slippages = [int(v) for v in value.split(",") if v]
+        elif flag == "--max-splits":
+            max_splits = int(value)
+        elif flag == "--concurrency":
+            concurrency = int(value)
+        else:
+            print(f"ERROR: unexpected argument {flag!r}", file=sys.stderr)
+            sys.exit(1)
+    if len(args) % 2:
+        print(f"ERROR: missing value for {args[-1]!r}", file=sys.stderr)
+        sys.exit(1)
+    return slippages, max_splits, concurrency
+
+
+def main():
+    use_cache = "--no-cache" not in sys.argv
+    if not use_cache:
+        sys.argv.remove("--no-cache")
+
+    if len(sys.argv) >= 5:
+        try:
+            to_smallest_units(sys.argv[4], int(sys.argv[3]))
+        except ValueError as e:
+            print(f"ERROR: {e}", file=sys.stderr)
+            sys.exit(1)
+
+    if len(sys.argv) >= 6 and sys.argv[5].startswith("--"):
+        dests, concurrency = parse_fanout_args(sys.argv[5:])
+        if not dests:
+            print("ERROR: no destinations given (use --to or --to-file)", file=sys.stderr)
+            sys.exit(1)
+        fanout(int(sys.argv[1]), sys.argv[2], int(sys.argv[3]), sys.argv[4], dests, concurrency, use_cache)
+        return
+
+    if len(sys.argv) < 8:
+        print(__doc__.strip())
+        sys.exit(1)
+
+    if "--sweep" in sys.argv[8:]:
+        slippages, max_splits, concurrency = parse_sweep_args(sys.argv[8:])
+        sweep(int(sys.argv[1]), sys.argv[2], int(sys.argv[3]), sys.argv[4],
+              int(sys.argv[5]), sys.argv[6], int(sys.argv[7]), slippages, max_splits, concurrency)
+        return
+
+    src_chain = int(sys.argv[1])
+    src_token = sys.argv[2]
+    src_dec = int(sys.argv[3])
+    amount = sys.argv[4]
+    dst_chain = int(sys.argv[5])
+    dst_token = sys.argv[6]
+    dst_dec = int(sys.argv[7])
+
+    try:
+        result, source = quote(src_chain, src_token, src_dec, to_smallest_units(amount, src_dec),
+                               dst_chain, dst_token, dst_dec, use_cache=use_cache)
+    except ValueError as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        sys.exit(1)
 
-    print(f"{amount} -> {out_human} (chain {src_chain} -> {dst_chain})")
-    print(f"Fee: ~${fee_usd:.4f}")
-    print(f"Estimated time: {est}s")
+    q = summarize(result, dst_dec)
+    print(f"{amount} -> {q['out']} (chain {src_chain} -> {dst_chain})")
+    print(f"Fee: ~${q['fee_usd']:.4f}")
+    print(f"Estimated time: {q['est']}s")
+    print(f"Source: {source}")
 
 
 if __name__ == "__main__":
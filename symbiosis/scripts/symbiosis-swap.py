@@ -1,37 +1,110 @@
 #!/usr/bin/env python3
 """Symbiosis cross-chain swap via Bankr Submit API.
 
-Usage: ./symbiosis-swap.sh <src_chain> <src_token> <src_decimals> <amount> <dst_chain> <dst_token> <dst_decimals> [slippage]
+Usage: ./symbiosis-swap.sh <src_chain> <src_token> <src_decimals> <amount> <dst_chain> <dst_token> <dst_decimals> [slippage] [--no-wait]
+       ./symbiosis-swap.sh --batch <jobs.jsonl> [--per-chain N] [--no-wait] [--retry ID[,ID...]]
+       ./symbiosis-swap.sh --track [--timeout SECONDS]
 
 Example: ./symbiosis-swap.sh 8453 0x833589fCD6eDb6E08f4c7C32D4f71b54bdA02913 6 2 137 0x3c499c542cEF5E3811e1192ce70d8cC03d5c3359 6
          (2 USDC from Base to Polygon)
+
+The ERC20 approve is skipped when the current allowance already covers the
+swap. Allowances are read over RPC (SYMBIOSIS_RPC_<chainId> overrides the
+default endpoint); when that read fails the approve is submitted. Approvals
+are recorded in ~/.cache/symbiosis/approvals.json, which stands in for a failed
+RPC read only with SYMBIOSIS_TRUST_LOCAL_APPROVALS=1.
+
+Every submitted swap is recorded in ~/.cache/symbiosis/swaps.json. With
+--no-wait the swap is submitted without waiting for confirmation and the
+script returns at once; --track then polls Symbiosis for all unfinished swaps
+and reports source-confirmed, relayed and received times.
+
+--batch runs one swap per JSONL line ({"src_chain", "src_token", "src_decimals",
+"amount", "dst_chain", "dst_token", "dst_decimals", optional "slippage"/"id"}).
+The wallet is resolved once, all jobs are quoted concurrently, submissions
+are limited per source chain, and progress is checkpointed to
+<jobs>.progress.json so a rerun skips jobs that already went through. A job
+is checkpointed as "submitting" before its swap goes to Bankr; if the submit
+then dies without a clear answer (timeout, Ctrl-C, crash) the job is left
+"uncertain" and never resubmitted automatically -- check it (with --track when
+its tx hash is known) and pass --retry ID only if the swap did not go out.
 """
 
+import hashlib
 import json
 import os
 import sys
+import threading
+import time
+import urllib.error
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from units import format_units, to_smallest_units, usd_value
 
 SYMBIOSIS_API = "https://api-v2.symbiosis.finance/crosschain/v1/swap"
+SYMBIOSIS_STATUS_API = "https://api-v2.symbiosis.finance/crosschain/v1/tx"
 BANKR_API = "https://api.bankr.bot"
 PARTNER_ID = "bankr"
 ZERO_ADDR = "0x0000000000000000000000000000000000000000"
-MAX_UINT256 = "f" * 64
-
-
-def to_smallest_units(amount: str, decimals: int) -> str:
-    parts = amount.split(".")
-    integer = parts[0]
-    frac = parts[1] if len(parts) > 1 else ""
-    frac = (frac + "0" * decimals)[:decimals]
-    return str(int(integer + frac))
-
-
-def format_units(amount_raw: str, decimals: int) -> str:
-    s = amount_raw.zfill(decimals + 1)
-    int_part = s[: len(s) - decimals] or "0"
-    frac_part = s[len(s) - decimals :].rstrip("0")
-    return f"{int_part}.{frac_part}" if frac_part else int_part
+MAX_UINT256 = 2**256 - 1
+APPROVE_SELECTOR = bytes.fromhex("095ea7b3")  # approve(address,uint256)
+ALLOWANCE_SELECTOR = bytes.fromhex("dd62ed3e")  # allowance(address,address)
+
+# Public RPC endpoints for Bankr source chains; SYMBIOSIS_RPC_<chainId> overrides.
+RPC_URLS = {
+    1: "https://ethereum-rpc.publicnode.com",
+    137: "https://polygon-rpc.com",
+    130: "https://mainnet.unichain.org",
+    8453: "https://mainnet.base.org",
+}
+CACHE_DIR = os.environ.get("SYMBIOSIS_CACHE_DIR", os.path.expanduser("~/.cache/symbiosis"))
+APPROVALS_FILE = os.path.join(CACHE_DIR, "approvals.json")
+# The local record can be stale (revoked, or spent from another tool), so it
+# only stands in for a failed RPC read when explicitly trusted.
+TRUST_LOCAL_APPROVALS = os.environ.get("SYMBIOSIS_TRUST_LOCAL_APPROVALS") == "1"
+SWAPS_FILE = os.path.join(CACHE_DIR, "swaps.json")
+
+# Tracker stages, in order; "failed" (reverted/stuck) is terminal as well.
+STAGES = ("submitted", "source_confirmed", "relayed", "received")
+TRACK_MIN_DELAY = 5
+TRACK_MAX_DELAY = 60
+DEFAULT_TRACK_TIMEOUT = 900
+
+DEFAULT_SLIPPAGE = 200
+DEFAULT_PER_CHAIN = 1  # one in-flight submit per source chain keeps nonces ordered
+QUOTE_MAX_AGE = 60  # re-quote a batch job that waited longer than this to submit
+# Batch job states whose swap may already be on chain; never resubmitted automatically.
+UNSURE_STATES = ("submitting", "uncertain")
+
+# Serializes read-modify-write of the JSON state files across batch threads.
+STATE_LOCK = threading.Lock()
+
+
+class SwapError(Exception):
+    """A swap step failed; the message is ready to show the user.
+
+    tx_hash is set when Bankr reported a failure for a transaction it had
+    already broadcast.
+    """
+
+    def __init__(self, message: str, tx_hash: str | None = None):
+        super().__init__(message)
+        self.tx_hash = tx_hash
+
+
+def encode_approve(spender: str, amount: int) -> str:
+    """ERC20 approve(address,uint256) calldata, built as bytes and hex-encoded once."""
+    spender_raw = bytes.fromhex(spender[2:])
+    if len(spender_raw) != 20:
+        raise ValueError(f"spender is not a 20-byte address: {spender}")
+    return "0x" + (APPROVE_SELECTOR + bytes(12) + spender_raw + amount.to_bytes(32, "big")).hex()
+
+
+def encode_allowance(owner: str, spender: str) -> str:
+    """ERC20 allowance(address,address) calldata."""
+    words = [bytes(12) + bytes.fromhex(a[2:]) for a in (owner, spender)]
+    return "0x" + (ALLOWANCE_SELECTOR + b"".join(words)).hex()
 
 
 def api_post(url: str, payload: dict, headers: dict | None = None) -> dict:
@@ -68,116 +141,552 @@ def get_wallet(bankr_key: str) -> str:
     return result["evmAddress"]
 
 
-def bankr_submit(bankr_key: str, tx: dict, description: str) -> dict:
+def rpc_url(chain_id: int) -> str | None:
+    return os.environ.get(f"SYMBIOSIS_RPC_{chain_id}", RPC_URLS.get(chain_id))
+
+
+def read_allowance(chain_id: int, token: str, owner: str, spender: str) -> int | None:
+    """On-chain ERC20 allowance, or None when the chain has no RPC or the call fails."""
+    url = rpc_url(chain_id)
+    if not url:
+        return None
+    try:
+        resp = api_post(url, {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "method": "eth_call",
+            "params": [{"to": token, "data": encode_allowance(owner, spender)}, "latest"],
+        })
+        return int(resp["result"], 16)
+    except Exception:
+        return None
+
+
+def approval_key(chain_id: int, token: str, owner: str, spender: str) -> str:
+    return f"{chain_id}:{token.lower()}:{owner.lower()}:{spender.lower()}"
+
+
+def load_json(path: str) -> dict:
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def write_json(path: str, obj: dict) -> None:
+    """Atomically replace a state file; failures are reported, not fatal."""
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(obj, f, indent=2)
+        os.replace(tmp, path)
+    except OSError as e:
+        print(f"WARNING: could not write {path}: {e}", file=sys.stderr)
+
+
+def load_approvals() -> dict:
+    return load_json(APPROVALS_FILE)
+
+
+def record_approval(key: str, amount: int) -> None:
+    """Persist the last known allowance for (chain, token, owner, spender)."""
+    with STATE_LOCK:
+        approvals = load_approvals()
+        approvals[key] = str(amount)
+        write_json(APPROVALS_FILE, approvals)
+
+
+def record_swap(swap_hash: str, entry: dict) -> None:
+    with STATE_LOCK:
+        swaps = load_json(SWAPS_FILE)
+        swaps[swap_hash] = entry
+        write_json(SWAPS_FILE, swaps)
+
+
+def bankr_submit(bankr_key: str, tx: dict, description: str, wait: bool = True) -> dict:
     return api_post(
         f"{BANKR_API}/agent/submit",
         {
             "transaction": tx,
             "description": description,
-            "waitForConfirmation": True,
+            "waitForConfirmation": wait,
         },
         {"X-API-Key": bankr_key},
     )
 
 
-def main():
-    if len(sys.argv) < 8:
-        print(__doc__.strip())
-        sys.exit(1)
-
-    src_chain = int(sys.argv[1])
-    src_token = sys.argv[2]
-    src_dec = int(sys.argv[3])
-    amount = sys.argv[4]
-    dst_chain = int(sys.argv[5])
-    dst_token = sys.argv[6]
-    dst_dec = int(sys.argv[7])
-    slippage = int(sys.argv[8]) if len(sys.argv) > 8 else 200
-
-    # --- Setup ---
-    bankr_key = load_bankr_key()
-    wallet = get_wallet(bankr_key)
-    amount_wei = to_smallest_units(amount, src_dec)
-    print(f"Wallet: {wallet}")
-    print(f"Amount in smallest units: {amount_wei}")
-
-    # --- Step 1: Get quote + calldata from Symbiosis ---
-    print("\n=== Getting Symbiosis quote ===")
+def fetch_status(src_chain: int, tx_hash: str) -> dict | None:
+    """Symbiosis status for a source tx, or None while it is not indexed yet."""
+    try:
+        return api_get(f"{SYMBIOSIS_STATUS_API}/{src_chain}/{tx_hash}", {})
+    except urllib.error.HTTPError as e:
+        if e.code == 404:
+            return None
+        raise
+
+
+def stage_of(status: dict | None) -> str:
+    """Map a Symbiosis status response onto a tracker stage.
+
+    Symbiosis only indexes a swap once its source tx is mined. Status code 0
+    means the destination tx succeeded and 2/3 mean stuck/reverted. While the
+    code is 1 (pending), a known destination tx hash means the relayer has
+    picked the swap up.
+    """
+    if status is None:
+        return "submitted"
+    code = status.get("status", {}).get("code")
+    if code == 0:
+        return "received"
+    if code in (2, 3):
+        return "failed"
+    if (status.get("tx") or {}).get("hash"):
+        return "relayed"
+    return "source_confirmed"
+
+
+def advance(entry: dict, stage: str, now: float) -> None:
+    """Move a swap to `stage`, stamping it and any stage it skipped past."""
+    entry["stage"] = stage
+    times = entry.setdefault("times", {})
+    if stage == "failed":
+        times.setdefault("failed", now)
+        return
+    for s in STAGES[: STAGES.index(stage) + 1]:
+        times.setdefault(s, now)
+
+
+def format_timeline(entry: dict) -> str:
+    times = entry.get("times", {})
+    start = times.get("submitted", entry.get("submitted_at", 0))
+    parts = [f"{s} +{times[s] - start:.0f}s" for s in STAGES[1:] + ("failed",) if s in times]
+    return ", ".join(parts) or "waiting"
+
+
+def track(timeout: float) -> None:
+    """Poll every unfinished swap in the state file until all finish or timeout.
+
+    Each swap keeps its own exponential backoff (TRACK_MIN_DELAY doubling to
+    TRACK_MAX_DELAY, reset on progress). Swaps due in the same round are
+    polled in parallel and the state file is rewritten after every round.
+    """
+    swaps = load_json(SWAPS_FILE)
+    active = {h: e for h, e in swaps.items() if e.get("stage") not in ("received", "failed")}
+    if not active:
+        print("No swaps in flight.")
+        return
+
+    print(f"Tracking {len(active)} swap(s)...")
+    deadline = time.time() + timeout
+    due = {h: 0.0 for h in active}
+    delay = {h: TRACK_MIN_DELAY for h in active}
+
+    with ThreadPoolExecutor(max_workers=min(8, len(active))) as pool:
+        while active and time.time() < deadline:
+            now = time.time()
+            ready = [h for h in active if due[h] <= now]
+            stages = list(pool.map(_poll, [active[h] for h in ready]))
+            for h, stage in zip(ready, stages):
+                entry = active[h]
+                # None is a transient API error: back off as if nothing changed.
+                if stage is not None and stage != entry["stage"]:
+                    advance(entry, stage, time.time())
+                    delay[h] = TRACK_MIN_DELAY
+                    print(f"{h[:10]}… {entry['src_chain']}->{entry['dst_chain']}: {stage} ({format_timeline(entry)})")
+                    if stage in ("received", "failed"):
+                        del active[h]
+                        continue
+                else:
+                    delay[h] = min(delay[h] * 2, TRACK_MAX_DELAY)
+                due[h] = time.time() + delay[h]
+            if ready:
+                write_json(SWAPS_FILE, swaps)
+            if active:
+                time.sleep(max(0.0, min(min(due[h] for h in active), deadline) - time.time()))
+
+    print("\n=== Swap status ===")
+    for h, entry in swaps.items():
+        print(f"{h}  {entry['src_chain']}->{entry['dst_chain']}  {entry['amount']} -> ~{entry.get('out', '?')}  "
+              f"{entry['stage']}  ({format_timeline(entry)})")
+    if active:
+        print(f"\n{len(active)} swap(s) still in flight; run --track again later.")
+
+
+def _poll(entry: dict) -> str | None:
+    try:
+        return stage_of(fetch_status(entry["src_chain"], entry["hash"]))
+    except Exception as e:
+        print(f"WARNING: status check for {entry['hash'][:10]}… failed: {e}", file=sys.stderr)
+        return None
+
+
+def pop_option(args: list[str], name: str, default=None):
+    """Remove `name VALUE` (or a bare flag when default is False) from args."""
+    if name not in args:
+        return default
+    i = args.index(name)
+    if default is False:
+        del args[i]
+        return True
+    value = args[i + 1]
+    del args[i : i + 2]
+    return value
+
+
+def get_swap_quote(wallet: str, job: dict) -> dict:
+    """Live Symbiosis quote + calldata for a job.
+
+    Always live: the quote cache in symbiosis-quote.py is for display only,
+    calldata we sign must come from a fresh quote.
+    """
     result = api_post(SYMBIOSIS_API, {
         "tokenAmountIn": {
-            "chainId": src_chain,
-            "address": src_token,
-            "decimals": src_dec,
-            "amount": amount_wei,
+            "chainId": job["src_chain"],
+            "address": job["src_token"],
+            "decimals": job["src_decimals"],
+            "amount": job["amount_wei"],
         },
         "tokenOut": {
-            "chainId": dst_chain,
-            "address": dst_token,
-            "decimals": dst_dec,
+            "chainId": job["dst_chain"],
+            "address": job["dst_token"],
+            "decimals": job["dst_decimals"],
         },
         "from": wallet,
         "to": wallet,
-        "slippage": slippage,
+        "slippage": job["slippage"],
         "partnerId": PARTNER_ID,
     })
-
     if "tx" not in result:
         msg = result.get("message", result.get("error", json.dumps(result)))
-        print(f"ERROR from Symbiosis API: {msg}", file=sys.stderr)
-        sys.exit(1)
+        raise SwapError(f"Symbiosis API: {msg}")
 
-    tx = result["tx"]
-    approve_to = result.get("approveTo", "")
     out = result.get("tokenAmountOut", {})
     fee = result.get("fee", {})
+    result["_out_human"] = format_units(out.get("amount", "0"), out.get("decimals", job["dst_decimals"]))
+    result["_fee_usd"] = usd_value(fee.get("amount", "0"), fee.get("decimals", 6), fee.get("priceUsd", 1))
+    result["_quoted_at"] = time.time()
+    return result
 
-    out_human = format_units(out.get("amount", "0"), out.get("decimals", dst_dec))
-    fee_human = float(format_units(fee.get("amount", "0"), fee.get("decimals", 6)))
-    fee_usd = fee_human * fee.get("priceUsd", 1)
-    est_time = result.get("estimatedTime", "?")
-
-    print(f"Quote: {amount} -> {out_human}")
-    print(f"Fee: ~${fee_usd:.4f}")
-    print(f"Estimated time: {est_time}s")
-    print(f"Symbiosis router: {tx['to']}")
-
-    # --- Step 2: Approve (if needed) ---
-    if approve_to and src_token.lower() != ZERO_ADDR:
-        print("\n=== Approving token for Symbiosis ===")
-        padded = approve_to[2:].lower().zfill(64)
-        approve_data = f"0x095ea7b3{padded}{MAX_UINT256}"
-
-        approve_result = bankr_submit(bankr_key, {
-            "to": src_token,
-            "chainId": src_chain,
-            "value": "0",
-            "data": approve_data,
-        }, "Approve token for Symbiosis cross-chain swap")
-
-        if not approve_result.get("success"):
-            print(f"ERROR: Approve failed: {json.dumps(approve_result)}", file=sys.stderr)
-            sys.exit(1)
-        print(f"Approve tx: {approve_result['transactionHash']}")
 
-    # --- Step 3: Submit swap ---
-    print("\n=== Submitting Symbiosis swap ===")
+def ensure_allowance(bankr_key: str, wallet: str, job: dict, result: dict, log=print):
+    """Approve approveTo if needed; returns (approval key, allowance before the swap).
+
+    Both are None for native tokens or when no approval target is given.
+    """
+    approve_to = result.get("approveTo", "")
+    src_chain, src_token = job["src_chain"], job["src_token"]
+    if not approve_to or src_token.lower() == ZERO_ADDR:
+        return None, None
+
+    key = approval_key(src_chain, src_token, wallet, approve_to)
+    allowance = read_allowance(src_chain, src_token, wallet, approve_to)
+    source = "on-chain"
+    if allowance is None and TRUST_LOCAL_APPROVALS:
+        allowance = int(load_approvals().get(key, 0))
+        source = "local record"
+        log(f"WARNING: could not read the allowance on chain {src_chain}; using the local record, "
+            "which may be stale")
+    elif allowance is None:
+        log(f"WARNING: could not read the allowance on chain {src_chain}; approving to be safe")
+        allowance = 0
+    if allowance >= int(job["amount_wei"]):
+        log(f"\n=== Allowance ({source}) already covers swap, skipping approve ===")
+        return key, allowance
+
+    log("\n=== Approving token for Symbiosis ===")
+    approve_result = bankr_submit(bankr_key, {
+        "to": src_token,
+        "chainId": src_chain,
+        "value": "0",
+        "data": encode_approve(approve_to, MAX_UINT256),
+    }, "Approve token for Symbiosis cross-chain swap")
+
+    if not approve_result.get("success"):
+        raise SwapError(f"Approve failed: {json.dumps(approve_result)}")
+    log(f"Approve tx: {approve_result['transactionHash']}")
+    return key, MAX_UINT256
+
+
+def submit_swap(bankr_key: str, job: dict, result: dict, key, approved, no_wait: bool) -> tuple[str, dict]:
+    """Submit the swap tx and record it for --track; returns (hash, Bankr response)."""
+    tx = result["tx"]
+    submitted_at = time.time()
     swap_result = bankr_submit(bankr_key, {
         "to": tx["to"],
-        "chainId": src_chain,
+        "chainId": job["src_chain"],
         "value": tx.get("value", "0"),
         "data": tx["data"],
-    }, "Symbiosis cross-chain swap")
+    }, "Symbiosis cross-chain swap", wait=not no_wait)
 
     if not swap_result.get("success"):
-        print(f"ERROR: Swap failed: {json.dumps(swap_result)}", file=sys.stderr)
-        sys.exit(1)
+        raise SwapError(f"Swap failed: {json.dumps(swap_result)}", swap_result.get("transactionHash"))
+
+    if approved is not None:
+        record_approval(key, approved - int(job["amount_wei"]))
 
     swap_hash = swap_result["transactionHash"]
+    entry = {
+        "hash": swap_hash,
+        "src_chain": job["src_chain"],
+        "dst_chain": job["dst_chain"],
+        "amount": job["amount"],
+        "out": result["_out_human"],
+        "submitted_at": submitted_at,
+    }
+    advance(entry, "submitted" if no_wait else "source_confirmed", time.time())
+    entry["times"]["submitted"] = submitted_at
+    record_swap(swap_hash, entry)
+    return swap_hash, swap_result
+
+
+def make_job(src_chain, src_token, src_decimals, amount, dst_chain, dst_token, dst_decimals,
+             slippage=DEFAULT_SLIPPAGE) -> dict:
+    job = {
+        "src_chain": int(src_chain),
+        "src_token": src_token,
+        "src_decimals": int(src_decimals),
+        "amount": str(amount),
+        "dst_chain": int(dst_chain),
+        "dst_token": dst_token,
+        "dst_decimals": int(dst_decimals),
+        "slippage": int(slippage),
+    }
+    job["amount_wei"] = to_smallest_units(job["amount"], job["src_decimals"])
+    return job
+
+
+def read_jobs(path: str) -> list[tuple[str, dict]]:
+    """Parse a JSONL job file into (job id, job); ids default to a hash of the line.
+
+    A repeated id-less line is a separate swap: its nth copy hashes with "#n"
+    appended. The count is per line text, not the line number, so adding or
+    removing other lines never renames a job whose progress is recorded.
+    Duplicate ids are an error, since one job's progress would mask the other's.
+    """
+    jobs = []
+    seen = {}  # job id -> line number
+    copies = {}  # id-less line text -> occurrences so far
+    with open(path) as f:
+        for lineno, line in enumerate(f, 1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            try:
+                spec = json.loads(line)
+                job = make_job(**{k: v for k, v in spec.items() if k != "id"})
+            except (ValueError, TypeError) as e:
+                print(f"ERROR: {path}:{lineno}: bad job: {e}", file=sys.stderr)
+                sys.exit(1)
+            if spec.get("id"):
+                job_id = str(spec["id"])
+            else:
+                copies[line] = copies.get(line, 0) + 1
+                key = line if copies[line] == 1 else f"{line}#{copies[line]}"
+                job_id = hashlib.sha256(key.encode()).hexdigest()[:12]
+            if job_id in seen:
+                print(f"ERROR: {path}:{lineno}: duplicate job id {job_id!r} (also on line {seen[job_id]})",
+                      file=sys.stderr)
+                sys.exit(1)
+            seen[job_id] = lineno
+            jobs.append((job_id, job))
+    return jobs
+
+
+def run_batch(path: str, per_chain: int, no_wait: bool, retry: list[str]) -> None:
+    """Quote every pending job concurrently, then submit with per-chain limits.
+
+    Jobs whose swap may already have been broadcast ("submitting" or
+    "uncertain" in the progress file) are reported and skipped, never resent,
+    unless named in `retry`.
+    """
+    jobs = read_jobs(path)
+    progress_path = f"{path}.progress.json"
+    progress = load_json(progress_path)
+    for job_id in retry:
+        progress.pop(job_id, None)
+
+    def state(job_id: str) -> str | None:
+        return progress.get(job_id, {}).get("status")
+
+    blocked = [job_id for job_id, _ in jobs if state(job_id) in UNSURE_STATES]
+    for job_id in blocked:
+        print(f"[{job_id}] NOT rerun: {describe_unsure(progress[job_id])}", file=sys.stderr)
+    pending = [(job_id, job) for job_id, job in jobs if state(job_id) not in ("done", *UNSURE_STATES)]
+    done = sum(1 for job_id, _ in jobs if state(job_id) == "done")
+    print(f"{len(jobs)} job(s), {done} already done, {len(blocked)} need review, {len(pending)} to run")
+    if retry:
+        write_json(progress_path, progress)
+    if not pending:
+        if blocked:
+            sys.exit(1)
+        return
+
+    bankr_key = load_bankr_key()
+    wallet = get_wallet(bankr_key)
+    print(f"Wallet: {wallet}")
+
+    progress_lock = threading.Lock()
+
+    def checkpoint(job_id: str, **fields) -> None:
+        with progress_lock:
+            progress[job_id] = {**progress.get(job_id, {}), **fields, "updated_at": time.time()}
+            write_json(progress_path, progress)
+
+    chain_slots = {}
+    for _, job in pending:
+        chain_slots.setdefault(job["src_chain"], threading.BoundedSemaphore(max(1, per_chain)))
+    approve_locks = {}  # (chain, token) -> Lock, so parallel jobs don't double-approve
+    stopping = threading.Event()  # set on Ctrl-C: finish in-flight submits, start no new ones
+
+    def run(job_id: str, job: dict, result: dict) -> None:
+        def log(msg):
+            print(f"[{job_id}] {msg.strip()}")
+
+        with chain_slots[job["src_chain"]]:
+            if stopping.is_set():
+                raise SwapError("batch interrupted before this swap was submitted")
+            if time.time() - result["_quoted_at"] > QUOTE_MAX_AGE:
+                result = get_swap_quote(wallet, job)
+            lock = approve_locks.setdefault((job["src_chain"], job["src_token"].lower()), threading.Lock())
+            with lock:
+                key, approved = ensure_allowance(bankr_key, wallet, job, result, log)
+                if stopping.is_set():
+                    raise SwapError("batch interrupted before this swap was submitted")
+                # From here on the swap may be broadcast: a rerun must not resend it blindly.
+                checkpoint(job_id, status="submitting", error=None)
+                swap_hash, _ = submit_swap(bankr_key, job, result, key, approved, no_wait)
+        checkpoint(job_id, status="done", hash=swap_hash, out=result["_out_human"])
+        log(f"{job['amount']} {job['src_chain']}->{job['dst_chain']} ~{result['_out_human']}  tx {swap_hash}")
+
+    def settle_failure(job_id: str, job: dict, e: Exception) -> str:
+        """Checkpoint a failed run; returns "failed" (safe to rerun) or "uncertain"."""
+        tx_hash = getattr(e, "tx_hash", None)
+        # A plain Bankr refusal without a tx hash means nothing was broadcast.
+        # Anything else after the "submitting" checkpoint may have sent the swap.
+        if state(job_id) == "submitting" and (tx_hash or not isinstance(e, SwapError)):
+            checkpoint(job_id, status="uncertain", error=str(e) or type(e).__name__, hash=tx_hash)
+            if tx_hash:
+                record_swap(tx_hash, {"hash": tx_hash, "src_chain": job["src_chain"], "dst_chain": job["dst_chain"],
+                                      "amount": job["amount"], "stage": "submitted", "submitted_at": time.time(),
+                                      "times": {"submitted": time.time()}})
+            print(f"[{job_id}] UNCERTAIN: {describe_unsure(progress[job_id])}", file=sys.stderr)
+            return "uncertain"
+        checkpoint(job_id, status="failed", error=str(e))
+        print(f"[{job_id}] failed: {e}", file=sys.stderr)
+        return "failed"
+
+    outcomes = {"failed": 0, "uncertain": 0}
+    pool = ThreadPoolExecutor(max_workers=min(16, len(pending)))
+    runs, settled = {}, set()
+
+    def settle_runs() -> None:
+        for fut in as_completed([f for f in runs if f not in settled]):
+            settled.add(fut)
+            job_id, job = runs[fut]
+            try:
+                fut.result()
+            except Exception as e:
+                outcomes[settle_failure(job_id, job, e)] += 1
+
+    try:
+        quotes = {pool.submit(get_swap_quote, wallet, job): (job_id, job) for job_id, job in pending}
+        for fut in as_completed(quotes):
+            job_id, job = quotes[fut]
+            try:
+                result = fut.result()
+            except Exception as e:
+                outcomes["failed"] += 1
+                checkpoint(job_id, status="failed", error=str(e))
+                print(f"[{job_id}] quote failed: {e}", file=sys.stderr)
+                continue
+            runs[pool.submit(run, job_id, job, result)] = (job_id, job)
+        settle_runs()
+    except KeyboardInterrupt:
+        # Swaps already handed to Bankr finish and get recorded; queued ones never start.
+        stopping.set()
+        print("\nInterrupted: waiting for swaps already being submitted; no new ones will start.", file=sys.stderr)
+        settle_runs()
+    pool.shutdown(cancel_futures=True)
+
+    submitted = sum(1 for job_id, _ in pending if state(job_id) == "done")
+    print(f"\n=== Batch finished: {submitted} submitted, {outcomes['failed']} failed, "
+          f"{outcomes['uncertain']} uncertain ===")
+    print(f"Progress: {progress_path}")
+    if no_wait:
+        print("Run with --track to follow the swaps to their destination chains.")
+    if outcomes["uncertain"] or blocked:
+        print("Uncertain jobs are not rerun automatically. Check them (--track follows those with a tx hash) "
+              "and pass --retry ID[,ID...] only for swaps that did not go out.", file=sys.stderr)
+    if submitted < len(pending) or blocked:
+        sys.exit(1)
+
+
+def describe_unsure(entry: dict) -> str:
+    """Why a job may already have been sent, and how to check it."""
+    why = entry.get("error") or "the previous run stopped while submitting it"
+    if entry.get("hash"):
+        return f"{why}; tx {entry['hash']} may have swapped -- follow it with --track"
+    return f"{why}; no tx hash is known -- check the wallet's history on chain before retrying"
+
+
+def main():
+    args = sys.argv[1:]
+    if pop_option(args, "--track", False):
+        track(float(pop_option(args, "--timeout", DEFAULT_TRACK_TIMEOUT)))
+        return
+    no_wait = pop_option(args, "--no-wait", False)
+    batch = pop_option(args, "--batch")
+    if batch:
+        retry = [i for i in (pop_option(args, "--retry") or "").split(",") if i]
+        run_batch(batch, int(pop_option(args, "--per-chain", DEFAULT_PER_CHAIN)), no_wait, retry)
+        return
+    sys.argv[1:] = args
+
+    if len(sys.argv) < 8:
+        print(__doc__.strip())
+        sys.exit(1)
+
+    try:
+        job = make_job(*sys.argv[1:9])
+    except ValueError as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    # --- Setup ---
+    bankr_key = load_bankr_key()
+    wallet = get_wallet(bankr_key)
+    print(f"Wallet: {wallet}")
+    print(f"Amount in smallest units: {job['amount_wei']}")
+
+    try:
+        # --- Step 1: Get quote + calldata from Symbiosis ---
+        print("\n=== Getting Symbiosis quote ===")
+        result = get_swap_quote(wallet, job)
+        print(f"Quote: {job['amount']} -> {result['_out_human']}")
+        print(f"Fee: ~${result['_fee_usd']:.4f}")
+        print(f"Estimated time: {result.get('estimatedTime', '?')}s")
+        print(f"Symbiosis router: {result['tx']['to']}")
+
+        # --- Step 2: Approve (if needed) ---
+        key, approved = ensure_allowance(bankr_key, wallet, job, result)
+
+        # --- Step 3: Submit swap ---
+        print("\n=== Submitting Symbiosis swap ===")
+        swap_hash, swap_result = submit_swap(bankr_key, job, result, key, approved, no_wait)
+    except SwapError as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    src_chain = job["src_chain"]
     print(f"Swap tx: {swap_hash}")
+    if no_wait:
+        print("Submitted without waiting; run with --track to follow it to the destination chain.")
     print(f"Status: {swap_result.get('status', 'unknown')}")
     print(f"\n=== SUCCESS ===")
-    print(f"Swapped {amount} on chain {src_chain} -> ~{out_human} on chain {dst_chain}")
-    print(f"Fee: ~${fee_usd:.4f} | Estimated arrival: {est_time}s")
+    print(f"Swapped {job['amount']} on chain {src_chain} -> ~{result['_out_human']} on chain {job['dst_chain']}")
+    print(f"Fee: ~${result['_fee_usd']:.4f} | Estimated arrival: {result.get('estimatedTime', '?')}s")
     print(f"Track: https://explorer.symbiosis.finance/transactions/{src_chain}/{swap_hash}")
 
 
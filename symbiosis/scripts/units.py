@@ -0,0 +1,79 @@
+"""Exact fixed-point conversion between human token amounts and smallest units.
+
+Shared by symbiosis-quote.py and symbiosis-swap.py. Everything is integer or
+Decimal arithmetic; no value passes through a float. Malformed amounts
+("", ".", "1.2.3", "-1", "1e6", "0x10", more fractional digits than the token
+has) raise ValueError instead of being silently truncated.
+
+    >>> parse_units("2.5", 6)
+    2500000
+    >>> format_units(2500000, 6)
+    '2.5'
+"""
+
+from decimal import Decimal
+
+
+def parse_units(amount: str, decimals: int) -> int:
+    """Human amount string -> integer smallest units."""
+    whole, dot, frac = amount.partition(".")
+    # isascii() first: str.isdigit() and int() also accept non-ASCII digits.
+    if (amount.isascii() and (whole.isdigit() or not whole) and (frac.isdigit() or not frac)
+            and (whole or frac)):
+        if len(frac) > decimals:
+            if frac[decimals:].strip("0"):
+                raise ValueError(f"{amount!r} has more than {decimals} decimal places")
+            frac = frac[:decimals]
+        return int(whole + frac or "0") * 10 ** (decimals - len(frac))
+    raise ValueError(f"invalid amount: {amount!r}")
+
+
+def parse_units_many(amounts, decimals: int) -> list[int]:
+    """parse_units over a sequence, with the powers of ten precomputed.
+
+    Well-formed amounts stay in the loop; anything else (too many decimals,
+    garbage) falls back to parse_units for its exact error.
+    """
+    scales = [10 ** (decimals - n) for n in range(decimals + 1)]
+    out = []
+    append = out.append
+    for amount in amounts:
+        whole, dot, frac = amount.partition(".")
+        if (len(frac) <= decimals and amount.isascii() and (whole.isdigit() or not whole)
+                and (frac.isdigit() or not frac) and (whole or frac)):
+            append(int(whole + frac or "0") * scales[len(frac)])
+        else:
+            append(parse_units(amount, decimals))
+    return out
+
+
+def to_smallest_units(amount: str, decimals: int) -> str:
+    """parse_units as a decimal string, the form the Symbiosis API expects."""
+    return str(parse_units(amount, decimals))
+
+
+def format_units(amount_raw, decimals: int) -> str:
+    """Integer smallest units (int or numeric string) -> minimal human string."""
+    digits = str(int(amount_raw))
+    sign = ""
+    if digits[0] == "-":
+        sign, digits = "-", digits[1:]
+    digits = digits.zfill(decimals + 1)
+    cut = len(digits) - decimals
+    frac = digits[cut:].rstrip("0")
+    return f"{sign}{digits[:cut]}.{frac}" if frac else sign + digits[:cut]
+
+
+def format_units_many(amounts_raw, decimals: int) -> list[str]:
+    return [format_units(raw, decimals) for raw in amounts_raw]
+
+
+def to_decimal(amount_raw, decimals: int) -> Decimal:
+    """Integer smallest units -> exact Decimal, for USD math on API amounts."""
+    # String construction is exact; scaleb() would round to the 28-digit context.
+    return Decimal(f"{int(amount_raw)}e-{decimals}")
+
+
+def usd_value(amount_raw, decimals: int, price_usd=1) -> Decimal:
+    """Exact USD value of a raw amount; prices are taken via str() so 0.1 stays 0.1."""
+    return to_decimal(amount_raw, decimals) * Decimal(str(price_usd))